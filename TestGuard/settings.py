@@ -115,6 +115,30 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Process-local cache. Session heartbeats are only buffered in the cache when it
+# is shared between processes (e.g. Redis or Memcached), since the cron flush
+# commands run in their own process; otherwise they are written directly.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Seconds between batched writes of buffered proctoring webhook events
+MONITORING_EVENT_FLUSH_INTERVAL = 1.0
+
+# Flushes a buffered proctoring event may fail before it is logged and dropped
+MONITORING_EVENT_MAX_RETRIES = 3
+
+# Key material for hashing exam passwords; changing it invalidates existing exam passwords
+EXAM_PASSWORD_PEPPER = SECRET_KEY
+
+# Background threads available for running bulk question imports
+QUESTION_IMPORT_WORKERS = 2
+
+# Rows per INSERT statement when bulk importing questions
+QUESTION_IMPORT_BATCH_SIZE = 1000
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0002_profile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='is_reviewer',
+            field=models.GeneratedField(db_persist=True, expression=models.Q(('role__in', ['ADMIN', 'INSTR'])), help_text='Can this user review monitoring events? Derived from role.', output_field=models.BooleanField()),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_reviewer', True)), fields=['last_name', 'first_name'], name='user_reviewer_idx'),
+        ),
+    ]
@@ -9,9 +9,10 @@ from django.core.validators import MinLengthValidator, RegexValidator, EmailVali
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.base import ContentFile
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 
@@ -196,6 +197,12 @@ class User(AbstractUser):
         blank=True,
         help_text="Institution this user belongs to.",
     )
+    is_reviewer = models.GeneratedField(
+        expression=models.Q(role__in=[Role.ADMIN, Role.INSTRUCTOR]),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        help_text="Can this user review monitoring events? Derived from role.",
+    )
 
     # Profile and security fields
     title = models.CharField(max_length=100, blank=True, help_text="Professional or academic title.")
@@ -223,6 +230,11 @@ class User(AbstractUser):
             models.Index(fields=["last_activity"]),
             models.Index(fields=["created_at"]),
             models.Index(fields=["created_by"]),
+            models.Index(
+                fields=["last_name", "first_name"],
+                condition=models.Q(is_reviewer=True),
+                name="user_reviewer_idx",
+            ),
         ]
         # Remove unique_together constraint for superadmins
         constraints = [
@@ -261,26 +273,40 @@ class User(AbstractUser):
         return f"{self.first_name} {self.last_name}".strip()
 
     # Role helpers
+    # One bit per role so single and grouped role checks are the same AND.
+    # Looked up on each access rather than cached, as role can be reassigned.
+    ROLE_BITS = {
+        Role.SUPERADMIN: 1,
+        Role.ADMIN: 2,
+        Role.INSTRUCTOR: 4,
+        Role.STUDENT: 8,
+    }
+    EDUCATOR_ROLE_BITS = ROLE_BITS[Role.ADMIN] | ROLE_BITS[Role.INSTRUCTOR]
+
+    @property
+    def _role_bits(self):
+        return self.ROLE_BITS.get(self.role, 0)
+
     @property
     def is_superadmin(self):
-        return self.role == self.Role.SUPERADMIN
+        return bool(self._role_bits & self.ROLE_BITS[self.Role.SUPERADMIN])
 
     @property
     def is_admin(self):
-        return self.role == self.Role.ADMIN
+        return bool(self._role_bits & self.ROLE_BITS[self.Role.ADMIN])
 
     @property
     def is_instructor(self):
-        return self.role == self.Role.INSTRUCTOR
+        return bool(self._role_bits & self.ROLE_BITS[self.Role.INSTRUCTOR])
 
     @property
     def is_student(self):
-        return self.role == self.Role.STUDENT
+        return bool(self._role_bits & self.ROLE_BITS[self.Role.STUDENT])
 
     @property
     def is_educator(self):
         """Check if user has educator privileges (Admin or Instructor)."""
-        return self.role in [self.Role.ADMIN, self.Role.INSTRUCTOR]
+        return bool(self._role_bits & self.EDUCATOR_ROLE_BITS)
 
     @classmethod
     def create_multiple(cls, user_data_list, institution, created_by):
@@ -702,24 +728,31 @@ class UserDeviceSession(models.Model):
         Returns:
             UserDeviceSession: The created or updated device session
         """
-        device_hash = cls.generate_device_hash(request)
+        meta = request.META
         
-        device_session, created = cls.objects.get_or_create(
+        # One INSERT ... ON CONFLICT statement, so concurrent first requests
+        # from the same device can't race into a unique constraint error.
+        # An existing session only has its activity timestamp refreshed.
+        device_hash = cls.generate_device_hash(request)
+        device_session = cls(
             user=user,
             device_hash=device_hash,
-            defaults={
-                'browser_name': request.META.get('HTTP_SEC_CH_UA', ''),
-                'browser_version': request.META.get('HTTP_SEC_CH_UA_VERSION', ''),
-                'os_name': request.META.get('HTTP_SEC_CH_UA_PLATFORM', ''),
-                'ip_address': cls.get_client_ip(request),
-                'user_agent': request.META.get('HTTP_USER_AGENT', '')
-            }
+            browser_name=meta.get('HTTP_SEC_CH_UA', ''),
+            browser_version=meta.get('HTTP_SEC_CH_UA_VERSION', ''),
+            os_name=meta.get('HTTP_SEC_CH_UA_PLATFORM', ''),
+            ip_address=cls.get_client_ip(request),
+            user_agent=meta.get('HTTP_USER_AGENT', '')
+        )
+        cls.objects.bulk_create(
+            [device_session],
+            update_conflicts=True,
+            unique_fields=['user', 'device_hash'],
+            update_fields=['last_activity'],
         )
         
-        if not created:
-            device_session.refresh_activity()
-            
-        return device_session
+        # On conflict the in-memory instance still holds this request's values
+        # (and, on some backends, no pk), so return the stored row instead
+        return cls.objects.get(user=user, device_hash=device_hash)
 
     @staticmethod
     def generate_device_hash(request):
@@ -962,4 +995,38 @@ class Enrollment(models.Model):
     @property
     def enrollment_duration(self):
         """Calculate the duration of the enrollment in days."""
-        return (timezone.now() - self.enrolled_on).days
\ No newline at end of file
+        return (timezone.now() - self.enrolled_on).days
+
+
+DASHBOARD_CACHE_TIMEOUT = 60
+DASHBOARD_VERSION_KEY = 'dash:version'
+
+
+def dashboard_cache_key(user):
+    """
+    Return the cache key for a user's dashboard context.
+    
+    Keys embed a shared version number, so bumping the version invalidates
+    every cached dashboard at once.
+    
+    Args:
+        user (User): User viewing the dashboard
+    """
+    version = cache.get_or_set(DASHBOARD_VERSION_KEY, 1, None)
+    return f'dash:{version}:{user.pk}:{user.role}'
+
+
+def invalidate_dashboards(sender, instance, update_fields=None, **kwargs):
+    """Expire cached dashboards when a model they summarize changes."""
+    # Logins only touch last_login, which no dashboard shows
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    try:
+        cache.incr(DASHBOARD_VERSION_KEY)
+    except ValueError:
+        cache.set(DASHBOARD_VERSION_KEY, 1, None)
+
+
+for dashboard_model in (Institution, User, AcademicDepartment, Course, Section, Enrollment):
+    post_save.connect(invalidate_dashboards, sender=dashboard_model)
+    post_delete.connect(invalidate_dashboards, sender=dashboard_model)
@@ -11,10 +11,12 @@ from django.utils import timezone
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.views import LoginView
+from django.core.cache import cache
 
 from .models import (
     Institution, User, AdminUserCreationLog, UserImportTemplate, 
-    UserDeviceSession, AcademicDepartment, Course, Section, Enrollment, Profile
+    UserDeviceSession, AcademicDepartment, Course, Section, Enrollment, Profile,
+    DASHBOARD_CACHE_TIMEOUT, dashboard_cache_key
 )
 from .forms import (
     InstitutionForm, UserForm, BulkUserUploadForm, AdminUserCreationLogForm,
@@ -32,17 +34,20 @@ class CustomLoginView(LoginView):
         return reverse('dashboard')
 
 # Utility functions
+def has_role(user, *roles):
+    return user.is_authenticated and user.role in roles
+
 def is_superadmin(user):
-    return user.is_authenticated and user.role == User.Role.SUPERADMIN
+    return has_role(user, User.Role.SUPERADMIN)
 
 def is_admin(user):
-    return user.is_authenticated and user.role == User.Role.ADMIN
+    return has_role(user, User.Role.ADMIN)
 
 def is_instructor(user):
-    return user.is_authenticated and user.role == User.Role.INSTRUCTOR
+    return has_role(user, User.Role.INSTRUCTOR)
 
 def is_student(user):
-    return user.is_authenticated and user.role == User.Role.STUDENT
+    return has_role(user, User.Role.STUDENT)
 
 def superadmin_required(view_func):
     decorated_view_func = login_required(user_passes_test(
@@ -54,7 +59,7 @@ def superadmin_required(view_func):
 
 def admin_required(view_func):
     decorated_view_func = login_required(user_passes_test(
-        lambda u: is_admin(u) or is_superadmin(u),
+        lambda u: has_role(u, User.Role.ADMIN, User.Role.SUPERADMIN),
         login_url='login',
         redirect_field_name=None
     )(view_func))
@@ -62,7 +67,7 @@ def admin_required(view_func):
 
 def instructor_required(view_func):
     decorated_view_func = login_required(user_passes_test(
-        lambda u: is_instructor(u) or is_admin(u) or is_superadmin(u),
+        lambda u: has_role(u, User.Role.INSTRUCTOR, User.Role.ADMIN, User.Role.SUPERADMIN),
         login_url='login',
         redirect_field_name=None
     )(view_func))
@@ -71,65 +76,69 @@ def instructor_required(view_func):
 # Dashboard View - This is the main entry point after login
 @login_required
 def dashboard(request):
+    # Resolve the lazy user once and branch on its role below
+    user = request.user
+    
+    # Dashboards are read far more often than the data behind them changes
+    cache_key = dashboard_cache_key(user)
+    context = cache.get(cache_key)
+    if context is not None:
+        return render(request, 'core/dashboard.html', context)
+    
     context = {}
+    role = user.role
     
-    if request.user.is_superadmin:
+    if role == User.Role.SUPERADMIN:
         # Superadmin dashboard - show all institutions
-        context['institutions'] = Institution.objects.all()
-        context['user_count'] = User.objects.filter(is_active=True).count()
-        context['student_count'] = User.objects.filter(
-            role=User.Role.STUDENT,
-            is_active=True
-        ).count()
-        context['instructor_count'] = User.objects.filter(
-            role__in=[User.Role.INSTRUCTOR, User.Role.ADMIN],
-            is_active=True
-        ).count()
-        context['institution_count'] = Institution.objects.filter(is_active=True).count()
+        context['institutions'] = list(Institution.objects.all())
+        context.update(User.objects.filter(is_active=True).aggregate(
+            user_count=Count('id'),
+            student_count=Count('id', filter=Q(role=User.Role.STUDENT)),
+            instructor_count=Count('id', filter=Q(role__in=[User.Role.INSTRUCTOR, User.Role.ADMIN]))
+        ))
+        # Count from the list already loaded rather than querying again
+        context['institution_count'] = sum(
+            1 for institution in context['institutions'] if institution.is_active
+        )
         
-    elif request.user.is_admin:
+    elif role == User.Role.ADMIN:
         # Admin dashboard - show only their institution
-        context['institution'] = request.user.institution
-        context['user_count'] = User.objects.filter(
-            institution=request.user.institution, 
-            is_active=True
-        ).count()
-        context['student_count'] = User.objects.filter(
-            institution=request.user.institution, 
-            role=User.Role.STUDENT,
-            is_active=True
-        ).count()
-        context['instructor_count'] = User.objects.filter(
-            institution=request.user.institution, 
-            role__in=[User.Role.INSTRUCTOR, User.Role.ADMIN],
-            is_active=True
-        ).count()
-        context['department_count'] = AcademicDepartment.objects.filter(
-            institution=request.user.institution,
+        context['institution'] = user.institution
+        context.update(User.objects.filter(
+            institution=user.institution, 
             is_active=True
-        ).count()
-        context['course_count'] = Course.objects.filter(
-            department__institution=request.user.institution,
-            is_active=True
-        ).count()
+        ).aggregate(
+            user_count=Count('id'),
+            student_count=Count('id', filter=Q(role=User.Role.STUDENT)),
+            instructor_count=Count('id', filter=Q(role__in=[User.Role.INSTRUCTOR, User.Role.ADMIN]))
+        ))
+        # Departments and their courses in one round trip
+        context.update(AcademicDepartment.objects.filter(
+            institution=user.institution
+        ).aggregate(
+            department_count=Count('id', filter=Q(is_active=True), distinct=True),
+            course_count=Count('courses', filter=Q(courses__is_active=True))
+        ))
         
-    elif request.user.is_instructor:
+    elif role == User.Role.INSTRUCTOR:
         # Instructor dashboard
-        context['teaching_sections'] = Section.objects.filter(
-            instructor=request.user,
+        context['teaching_sections'] = list(Section.objects.filter(
+            instructor=user,
             is_active=True
-        ).select_related('course')
+        ).select_related('course'))
         context['student_count'] = Enrollment.objects.filter(
-            section__instructor=request.user,
+            section__instructor=user,
             is_active=True
         ).count()
         
-    elif request.user.is_student:
+    elif role == User.Role.STUDENT:
         # Student dashboard
-        context['enrollments'] = Enrollment.objects.filter(
-            student=request.user,
+        context['enrollments'] = list(Enrollment.objects.filter(
+            student=user,
             is_active=True
-        ).select_related('section__course', 'section__instructor')
+        ).select_related('section__course', 'section__instructor'))
+    
+    cache.set(cache_key, context, DASHBOARD_CACHE_TIMEOUT)
     
     # Add this line to use the correct template path
     return render(request, 'core/dashboard.html', context)
@@ -210,7 +219,7 @@ def profile_verify(request, pk):
     
     profile.is_verified = True
     profile.verified_at = timezone.now()
-    profile.save()
+    profile.save(update_fields=['is_verified', 'verified_at', 'updated_at'])
     
     messages.success(request, 'Profile verified successfully.')
     return redirect('profile_admin_detail', pk=profile.pk)
@@ -225,7 +234,7 @@ def profile_unverify(request, pk):
     
     profile.is_verified = False
     profile.verified_at = None
-    profile.save()
+    profile.save(update_fields=['is_verified', 'verified_at', 'updated_at'])
     
     messages.success(request, 'Profile verification removed successfully.')
     return redirect('profile_admin_detail', pk=profile.pk)
@@ -300,7 +309,7 @@ class InstitutionDetailView(DetailView):
 def institution_toggle_active(request, pk):
     institution = get_object_or_404(Institution, pk=pk)
     institution.is_active = not institution.is_active
-    institution.save()
+    institution.save(update_fields=['is_active', 'updated_at'])
     
     action = "activated" if institution.is_active else "deactivated"
     messages.success(request, f'Institution {action} successfully.')
@@ -467,7 +476,7 @@ def user_toggle_active(request, pk):
         return redirect('user_list')
     
     user.is_active = not user.is_active
-    user.save()
+    user.save(update_fields=['is_active', 'updated_at'])
     
     action = "activated" if user.is_active else "deactivated"
     messages.success(request, f'User {action} successfully.')
@@ -638,7 +647,7 @@ def user_import_template_delete(request, pk):
         raise PermissionDenied
     
     template.is_active = False
-    template.save()
+    template.save(update_fields=['is_active'])
     messages.success(request, 'Template deleted successfully.')
     return redirect('user_import_template_list')
 
@@ -728,7 +737,7 @@ def academic_department_toggle_active(request, pk):
         raise PermissionDenied
     
     department.is_active = not department.is_active
-    department.save()
+    department.save(update_fields=['is_active'])
     
     action = "activated" if department.is_active else "deactivated"
     messages.success(request, f'Department {action} successfully.')
@@ -833,7 +842,7 @@ def course_toggle_active(request, pk):
         raise PermissionDenied
     
     course.is_active = not course.is_active
-    course.save()
+    course.save(update_fields=['is_active'])
     
     action = "activated" if course.is_active else "deactivated"
     messages.success(request, f'Course {action} successfully.')
@@ -952,7 +961,7 @@ def section_toggle_active(request, pk):
         raise PermissionDenied
     
     section.is_active = not section.is_active
-    section.save()
+    section.save(update_fields=['is_active'])
     
     action = "activated" if section.is_active else "deactivated"
     messages.success(request, f'Section {action} successfully.')
@@ -1071,7 +1080,7 @@ def enrollment_toggle_active(request, pk):
         raise PermissionDenied
     
     enrollment.is_active = not enrollment.is_active
-    enrollment.save()
+    enrollment.save(update_fields=['is_active'])
     action = "activated" if enrollment.is_active else "deactivated"
     messages.success(request, f'Enrollment {action} successfully.')
     
@@ -21,19 +21,23 @@ class BulkQuestionUploadForm(forms.ModelForm):
             }),
             'import_file': forms.FileInput(attrs={
                 'class': 'w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500',
-                'accept': '.xlsx,.xls'
+                'accept': '.xlsx,.xls,.csv'
             }),
         }
         labels = {
-            'import_file': 'Excel File',
+            'import_file': 'Excel or CSV File',
         }
     
     def __init__(self, *args, **kwargs):
         self.uploaded_by = kwargs.pop('uploaded_by', None)
+        question_bank = kwargs.pop('question_bank', None)
         super().__init__(*args, **kwargs)
         
-        # Limit question banks to those accessible by the user
-        if self.uploaded_by:
+        if question_bank is not None:
+            # The bank is already chosen, e.g. by the upload page's URL
+            del self.fields['question_bank']
+        elif self.uploaded_by:
+            # Limit question banks to those accessible by the user
             self.fields['question_bank'].queryset = QuestionBank.objects.filter(
                 institution=self.uploaded_by.institution
             )
@@ -159,12 +163,29 @@ class ExamForm(forms.ModelForm):
         }),
         required=False
     )
+    exam_password = forms.CharField(
+        required=False,
+        max_length=100,
+        widget=forms.PasswordInput(attrs={
+            'class': 'w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500',
+            'autocomplete': 'new-password',
+            'placeholder': 'Optional exam password'
+        }),
+        help_text="Leave blank to keep the current password."
+    )
+    clear_exam_password = forms.BooleanField(
+        required=False,
+        widget=forms.CheckboxInput(attrs={
+            'class': 'h-4 w-4 text-indigo-600 focus:ring-indigo-500 border-gray-300 rounded'
+        }),
+        help_text="Remove the password requirement from this exam."
+    )
     
     class Meta:
         model = Exam
         fields = [
             'title', 'description', 'instructions', 'duration', 'max_attempts', 
-            'pass_percentage', 'exam_password', 'start_date', 'end_date', 'time_zone',
+            'pass_percentage', 'start_date', 'end_date', 'time_zone',
             'shuffle_questions', 'shuffle_answers', 'disable_copy_paste', 
             'full_screen_required', 'require_webcam', 'allow_backtracking', 
             'enable_auto_save', 'sections'
@@ -198,11 +219,6 @@ class ExamForm(forms.ModelForm):
                 'min': '0',
                 'max': '100'
             }),
-            'exam_password': forms.PasswordInput(attrs={
-                'class': 'w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500',
-                'autocomplete': 'new-password',
-                'placeholder': 'Optional exam password'
-            }),
             'start_date': forms.DateTimeInput(attrs={
                 'class': 'w-full px-3 py-2 border border-gray-300 rounded-md shadow-sm focus:outline-none focus:ring-indigo-500 focus:border-indigo-500',
                 'type': 'datetime-local'
@@ -262,6 +278,12 @@ class ExamForm(forms.ModelForm):
         if self.created_by:
             instance.created_by = self.created_by
         
+        # Only a digest of the password is stored, so a blank field keeps the current one
+        if self.cleaned_data.get('clear_exam_password'):
+            instance.set_exam_password('')
+        elif self.cleaned_data.get('exam_password'):
+            instance.set_exam_password(self.cleaned_data['exam_password'])
+        
         if commit:
             instance.save()
             self.save_m2m()  # Save the many-to-many sections field
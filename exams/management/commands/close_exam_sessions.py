@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from exams.models import ActiveExamSession
+
+
+class Command(BaseCommand):
+    help = "Deactivate active sessions for exams whose scheduled window has ended."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'exam_ids',
+            nargs='*',
+            type=int,
+            help="Close sessions for these exams instead of every ended exam"
+        )
+
+    def handle(self, *args, **options):
+        exam_ids = options['exam_ids']
+        if not exam_ids:
+            exam_ids = ActiveExamSession.objects.filter(
+                is_active=True,
+                exam__end_date__lt=timezone.now()
+            ).values_list('exam_id', flat=True).distinct()
+
+        total = 0
+        for exam_id in exam_ids:
+            total += ActiveExamSession.bulk_deactivate_for_exam(exam_id)
+        self.stdout.write(f"Deactivated {total} active exam session(s).")
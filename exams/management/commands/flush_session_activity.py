@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from exams.tasks import flush_session_activity
+
+
+class Command(BaseCommand):
+    help = "Persist cached active exam session activity timestamps to the database."
+
+    def handle(self, *args, **options):
+        updated = flush_session_activity()
+        self.stdout.write(f"Flushed activity for {updated} active session(s).")
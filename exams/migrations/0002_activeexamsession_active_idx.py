@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_profile'),
+        ('exams', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activeexamsession',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', 'exam', 'is_active'], name='aes_active_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:11
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def populate_total_points(apps, schema_editor):
+    Exam = apps.get_model('exams', 'Exam')
+    ExamQuestion = apps.get_model('exams', 'ExamQuestion')
+    totals = ExamQuestion.objects.filter(
+        exam=OuterRef('pk')
+    ).values('exam').annotate(total=Sum('points')).values('total')
+    Exam.objects.update(
+        total_points=Coalesce(
+            Subquery(totals, output_field=models.DecimalField(max_digits=8, decimal_places=2)),
+            0,
+            output_field=models.DecimalField(max_digits=8, decimal_places=2)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0002_activeexamsession_active_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exam',
+            name='total_points',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, help_text='Total possible points, maintained from exam question point values', max_digits=8),
+        ),
+        migrations.RunPython(populate_total_points, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:17
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0003_exam_total_points'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activeexamsession',
+            name='last_activity',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='Timestamp of the last activity in this session, flushed periodically from the cache'),
+        ),
+    ]
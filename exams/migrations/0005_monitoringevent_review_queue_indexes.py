@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0004_activeexamsession_last_activity_default'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='monitoringevent',
+            name='exams_monit_reviewe_a10a8a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='monitoringevent',
+            name='exams_monit_severit_0c5e19_idx',
+        ),
+        migrations.AddIndex(
+            model_name='monitoringevent',
+            index=models.Index(fields=['reviewed_status', '-severity', '-timestamp'], name='me_status_sev_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitoringevent',
+            index=models.Index(condition=models.Q(('reviewed_status', 'PENDING'), ('severity__gte', 8)), fields=['-timestamp'], name='me_pending_hi_idx'),
+        ),
+    ]
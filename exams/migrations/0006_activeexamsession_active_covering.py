@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_profile'),
+        ('exams', '0005_monitoringevent_review_queue_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='activeexamsession',
+            name='exams_activ_is_acti_33980a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='activeexamsession',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['risk_level', '-last_activity', 'user', 'exam', 'attempt'], name='aes_active_covering'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:21
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_pending_events(apps, schema_editor):
+    ExamAttempt = apps.get_model('exams', 'ExamAttempt')
+    MonitoringEvent = apps.get_model('exams', 'MonitoringEvent')
+    pending = MonitoringEvent.objects.filter(
+        attempt=OuterRef('pk'),
+        reviewed_status='PENDING'
+    ).order_by().values('attempt')
+    ExamAttempt.objects.update(
+        pending_events_count=Coalesce(
+            Subquery(pending.annotate(n=Count('pk')).values('n')), 0
+        ),
+        max_pending_severity=Coalesce(
+            Subquery(pending.annotate(m=Max('severity')).values('m')), 0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_profile'),
+        ('exams', '0006_activeexamsession_active_covering'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='examattempt',
+            name='max_pending_severity',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Highest severity among monitoring events awaiting review'),
+        ),
+        migrations.AddField(
+            model_name='examattempt',
+            name='pending_events_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of monitoring events awaiting review'),
+        ),
+        migrations.AddIndex(
+            model_name='examattempt',
+            index=models.Index(fields=['-max_pending_severity', '-pending_events_count'], name='attempt_pending_events_idx'),
+        ),
+        migrations.RunPython(populate_pending_events, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:21
+
+import django.core.validators
+import exams.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0007_examattempt_pending_events'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='monitoringevent',
+            name='evidence',
+            field=models.JSONField(default=dict, help_text='Supporting evidence and contextual data for the event; large media is stored separately and referenced here', validators=[exams.models.validate_evidence_size]),
+        ),
+        migrations.AlterField(
+            model_name='monitoringevent',
+            name='severity',
+            field=models.PositiveSmallIntegerField(default=5, help_text='Severity level from 1 (low) to 10 (critical)', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(10)]),
+        ),
+    ]
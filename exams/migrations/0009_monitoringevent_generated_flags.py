@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0008_monitoringevent_compact_columns'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='monitoringevent',
+            name='is_resolved',
+            field=models.GeneratedField(db_persist=True, expression=models.Q(('reviewed_status__in', ['APPROVED', 'VIOLATION', 'FALSE_ALARM'])), help_text='Whether the event has been fully reviewed and addressed', output_field=models.BooleanField()),
+        ),
+        migrations.AddField(
+            model_name='monitoringevent',
+            name='requires_immediate_attention',
+            field=models.GeneratedField(db_persist=True, expression=models.Q(('severity__gte', 8)), help_text='Whether event severity warrants immediate action', output_field=models.BooleanField()),
+        ),
+        migrations.AddIndex(
+            model_name='monitoringevent',
+            index=models.Index(condition=models.Q(('requires_immediate_attention', True)), fields=['timestamp'], name='me_urgent_idx'),
+        ),
+    ]
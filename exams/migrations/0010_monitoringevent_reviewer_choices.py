@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0009_monitoringevent_generated_flags'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='monitoringevent',
+            name='reviewed_by',
+            field=models.ForeignKey(blank=True, help_text='Staff member who reviewed this event', limit_choices_to={'is_reviewer': True}, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
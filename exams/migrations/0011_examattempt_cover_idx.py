@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_user_is_reviewer'),
+        ('exams', '0010_monitoringevent_reviewer_choices'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='examattempt',
+            name='exams_exama_exam_id_5762a3_idx',
+        ),
+        migrations.AddIndex(
+            model_name='examattempt',
+            index=models.Index(fields=['exam', 'student', 'status', 'start_time', 'device_session', 'session_token'], name='examattempt_cover_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:38
+
+import hashlib
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def hash_existing_passwords(apps, schema_editor):
+    """Replace plaintext exam passwords with their keyed BLAKE2b digests."""
+    Exam = apps.get_model('exams', 'Exam')
+    pepper = getattr(settings, 'EXAM_PASSWORD_PEPPER', settings.SECRET_KEY)
+    key = hashlib.blake2b(pepper.encode('utf-8'), digest_size=32).digest()
+    exams = []
+    for exam in Exam.objects.exclude(exam_password='').only('pk', 'exam_password'):
+        if exam.exam_password.isspace():
+            continue
+        exam.exam_password_hash = hashlib.blake2b(
+            exam.exam_password.encode('utf-8'), key=key, digest_size=32
+        ).digest()
+        exams.append(exam)
+    Exam.objects.bulk_update(exams, ['exam_password_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0011_examattempt_cover_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exam',
+            name='exam_password_hash',
+            field=models.BinaryField(blank=True, default=b'', help_text='Keyed hash of the optional password required for exam access', max_length=32),
+        ),
+        # Plaintext passwords cannot be recovered from the digest, so this is one-way
+        migrations.RunPython(hash_existing_passwords, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='exam',
+            name='exam_password',
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+FACETS = ('face_count', 'voice_db', 'tab_switches')
+
+
+def move_evidence_facets(apps, schema_editor):
+    MonitoringEvent = apps.get_model('exams', 'MonitoringEvent')
+    events = []
+    for event in MonitoringEvent.objects.filter(evidence__has_any_keys=FACETS).only('pk', 'evidence'):
+        for field in FACETS:
+            value = event.evidence.get(field)
+            if isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 32767:
+                setattr(event, field, event.evidence.pop(field))
+        events.append(event)
+    MonitoringEvent.objects.bulk_update(events, ['evidence', *FACETS], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0012_exam_password_hash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='monitoringevent',
+            name='face_count',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Number of faces detected in the webcam frame', null=True),
+        ),
+        migrations.AddField(
+            model_name='monitoringevent',
+            name='tab_switches',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Number of tab or window switches reported by the client', null=True),
+        ),
+        migrations.AddField(
+            model_name='monitoringevent',
+            name='voice_db',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Detected voice level in decibels', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='monitoringevent',
+            index=models.Index(condition=models.Q(('face_count__isnull', False)), fields=['face_count'], name='me_face_count_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitoringevent',
+            index=models.Index(condition=models.Q(('voice_db__isnull', False)), fields=['voice_db'], name='me_voice_db_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monitoringevent',
+            index=models.Index(condition=models.Q(('tab_switches__isnull', False)), fields=['tab_switches'], name='me_tab_switches_idx'),
+        ),
+        migrations.RunPython(move_evidence_facets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:45
+
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0013_monitoringevent_evidence_facets'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='question',
+            constraint=models.CheckConstraint(condition=models.Q(('points__gte', Decimal('0.01'))), name='question_points_pos'),
+        ),
+    ]
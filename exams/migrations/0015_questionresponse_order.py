@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:56
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def copy_question_order(apps, schema_editor):
+    ExamQuestion = apps.get_model('exams', 'ExamQuestion')
+    QuestionResponse = apps.get_model('exams', 'QuestionResponse')
+    question_order = ExamQuestion.objects.filter(
+        exam__attempts=OuterRef('attempt_id'),
+        question_id=OuterRef('question_id'),
+    ).values('order')[:1]
+    QuestionResponse.objects.update(order=Coalesce(Subquery(question_order), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0014_question_points_pos'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='questionresponse',
+            name='order',
+            field=models.PositiveIntegerField(default=0, help_text='Position of the question in the exam, copied from ExamQuestion.order'),
+        ),
+        migrations.AddIndex(
+            model_name='questionresponse',
+            index=models.Index(fields=['attempt', 'order'], name='qr_attempt_order_idx'),
+        ),
+        migrations.RunPython(copy_question_order, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_user_is_reviewer'),
+        ('exams', '0015_questionresponse_order'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='examattempt',
+            index=models.Index(fields=['exam', 'status'], name='attempt_exam_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='examattempt',
+            index=models.Index(fields=['status', 'start_time'], name='attempt_status_start_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_user_is_reviewer'),
+        ('exams', '0016_examattempt_status_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='questionresponse',
+            name='exams_quest_attempt_2029e0_idx',
+        ),
+        migrations.AlterUniqueTogether(
+            name='questionresponse',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(fields=['status', 'start_date', 'end_date'], name='exam_status_window_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='questionresponse',
+            constraint=models.UniqueConstraint(fields=('attempt', 'question'), name='uniq_resp'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:18
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_active_questions(apps, schema_editor):
+    Question = apps.get_model('exams', 'Question')
+    QuestionBank = apps.get_model('exams', 'QuestionBank')
+    active_count = Question.objects.filter(
+        bank_id=OuterRef('pk'),
+        is_active=True,
+    ).order_by().values('bank_id').annotate(total=Count('pk')).values('total')
+    QuestionBank.objects.update(active_question_count=Coalesce(Subquery(active_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0017_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='questionbank',
+            name='active_question_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of active questions in this bank, maintained on question save and delete'),
+        ),
+        migrations.RunPython(count_active_questions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:50
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0018_questionbank_active_question_count'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='activeexamsession',
+            name='aes_active_idx',
+        ),
+    ]
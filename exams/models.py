@@ -1,14 +1,37 @@
+import functools
+import hashlib
+import hmac
+import json
 import uuid
+import numpy as np
+import openpyxl
 import pandas as pd
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
 from io import BytesIO
-from django.db import models
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models import Count, Exists, ExpressionWrapper, F, Max, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest, NullIf
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.core.exceptions import ValidationError
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import m2m_changed, pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.core.files.base import ContentFile
-from core.models import User, Section, Institution, UserDeviceSession
+from core.models import (
+    User, Section, Institution, UserDeviceSession, Enrollment, Course, AcademicDepartment
+)
+
+try:
+    # Optional: loads large event batches with PostgreSQL COPY
+    from django_bulk_load import bulk_insert_models
+except ImportError:
+    bulk_insert_models = None
 
 
 class BulkQuestionImport(models.Model):
@@ -85,6 +108,21 @@ class BulkQuestionImport(models.Model):
         verbose_name = "Bulk Question Import"
         verbose_name_plural = "Bulk Question Imports"
 
+    # Number of spreadsheet rows validated and inserted per transaction
+    BATCH_SIZE = 10000
+    # Default rows per INSERT statement; override with settings.QUESTION_IMPORT_BATCH_SIZE
+    INSERT_BATCH_SIZE = 1000
+    # Upper bound on individual error lines kept in error_log
+    MAX_LOGGED_ERRORS = 1000
+    # Leading bytes of .xlsx (zip container) and legacy .xls (OLE2) workbooks
+    XLSX_SIGNATURE = b'PK\x03\x04'
+    XLS_SIGNATURE = b'\xd0\xcf\x11\xe0'
+    # Columns read from import files; anything else in the sheet is ignored
+    IMPORT_COLUMNS = frozenset({
+        'question_text', 'type', 'points', 'estimated_time', 'learning_objective', 'is_active'
+    })
+    TEXT_COLUMN_DTYPES = {'question_text': str, 'type': 'category', 'learning_objective': str}
+
     def __str__(self):
         return f"Question Import #{self.id} for {self.question_bank.name} - {self.get_status_display()}"
 
@@ -95,25 +133,104 @@ class BulkQuestionImport(models.Model):
         """
         self.status = self.Status.PROCESSING
         self.started_at = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'started_at'])
 
         try:
-            # Parse and process the Excel file
-            df = pd.read_excel(self.import_file.path)
+            # Question.clean() only compares bank and creator institutions, which
+            # are the same for every row, so check it once instead of per row
+            if self.question_bank.institution_id != self.uploaded_by.institution_id:
+                raise ValidationError("Question bank and creator must belong to the same institution.")
+            
+            # Parse and process the spreadsheet
+            df = self._read_import_file()
             self.total_records = len(df)
+            df, row_errors = self._prepare_import_rows(df)
             
             success_count = 0
+            failed_count = 0
             errors = []
+            logged_errors = 0
+            truncated_errors = 0
+            insert_batch_size = getattr(
+                settings, 'QUESTION_IMPORT_BATCH_SIZE', self.INSERT_BATCH_SIZE
+            )
+            bank_id = self.question_bank_id
+            creator_id = self.uploaded_by_id
             
-            for index, row in df.iterrows():
-                try:
-                    self._create_question_from_row(row)
-                    success_count += 1
-                except Exception as e:
-                    errors.append(f"Row {index + 2}: {str(e)}")
+            # Validate and insert in fixed-size batches to bound memory and commit cost
+            for start in range(0, self.total_records, self.BATCH_SIZE):
+                chunk = df.iloc[start:start + self.BATCH_SIZE]
+                chunk_errors = row_errors.iloc[start:start + self.BATCH_SIZE]
+                invalid = chunk_errors.notna()
+                
+                for offset, message in zip(invalid.to_numpy().nonzero()[0], chunk_errors[invalid]):
+                    failed_count += 1
+                    if len(errors) < self.MAX_LOGGED_ERRORS:
+                        errors.append(f"Row {start + offset + 2}: {message}")
+                    else:
+                        truncated_errors += 1
+                
+                questions = [
+                    Question(
+                        question_text=question_text,
+                        type=question_type,
+                        bank_id=bank_id,
+                        points=points,
+                        estimated_time=estimated_time,
+                        learning_objective=learning_objective,
+                        created_by_id=creator_id,
+                        is_active=is_active
+                    )
+                    for question_text, question_type, points, estimated_time,
+                        learning_objective, is_active
+                    in chunk[~invalid].itertuples(index=False, name=None)
+                ]
+                
+                if questions:
+                    try:
+                        with transaction.atomic():
+                            Question.objects.bulk_create(questions, batch_size=insert_batch_size)
+                        success_count += len(questions)
+                        created_questions = questions
+                    except Exception:
+                        # Retry the batch row by row so one bad row cannot fail the rest
+                        created_questions = []
+                        for offset, question in zip((~invalid).to_numpy().nonzero()[0], questions):
+                            # Rolled-back sub-batches may have assigned primary keys
+                            question.pk = None
+                            question._state.adding = True
+                            try:
+                                with transaction.atomic():
+                                    Question.objects.bulk_create([question])
+                                success_count += 1
+                                created_questions.append(question)
+                            except Exception as e:
+                                failed_count += 1
+                                if len(errors) < self.MAX_LOGGED_ERRORS:
+                                    errors.append(f"Row {start + offset + 2}: {str(e)}")
+                                else:
+                                    truncated_errors += 1
+                    
+                    # bulk_create skips signals, so count the new active questions here
+                    _adjust_bank_question_count(
+                        bank_id, sum(1 for question in created_questions if question.is_active)
+                    )
+                
+                # Publish progress and errors so far so the import can be polled while it runs
+                self.successful_imports = success_count
+                self.failed_imports = failed_count
+                update_fields = ['total_records', 'successful_imports', 'failed_imports']
+                if len(errors) != logged_errors:
+                    self.error_log = "\n".join(errors)
+                    logged_errors = len(errors)
+                    update_fields.append('error_log')
+                self.save(update_fields=update_fields)
+            
+            if truncated_errors:
+                errors.append(f"... and {truncated_errors} more errors")
             
             self.successful_imports = success_count
-            self.failed_imports = len(errors)
+            self.failed_imports = failed_count
             self.error_log = "\n".join(errors)
             
             # Determine final status based on processing results
@@ -127,45 +244,145 @@ class BulkQuestionImport(models.Model):
             self.error_log = f"File processing error: {str(e)}"
         
         self.completed_at = timezone.now()
-        self.save()
+        self.save(update_fields=[
+            'status', 'total_records', 'successful_imports',
+            'failed_imports', 'error_log', 'completed_at'
+        ])
 
-    def _create_question_from_row(self, row):
+    def _read_import_file(self):
+        """
+        Load the uploaded import file into a DataFrame.
+        
+        Excel workbooks are detected by their file signature; any other
+        content is parsed with the considerably faster CSV reader. Workbooks
+        are read with the calamine engine when python-calamine is installed,
+        otherwise .xlsx files are streamed through openpyxl in read-only mode.
+        
+        The file is read through the storage backend rather than a local
+        path, so imports also work with remote storage.
+        
+        Returns:
+            pandas.DataFrame: Parsed import rows
+        """
+        read_options = {
+            'usecols': lambda column: column in self.IMPORT_COLUMNS,
+            'dtype': self.TEXT_COLUMN_DTYPES,
+        }
+        with self.import_file.open('rb') as f:
+            signature = f.read(4)
+            f.seek(0)
+            if signature in (self.XLSX_SIGNATURE, self.XLS_SIGNATURE):
+                try:
+                    return pd.read_excel(f, engine='calamine', **read_options)
+                except ImportError:
+                    f.seek(0)
+                    if signature == self.XLSX_SIGNATURE:
+                        return self._read_xlsx_values(f)
+                    return pd.read_excel(f, **read_options)
+            return pd.read_csv(f, **read_options)
+
+    def _read_xlsx_values(self, file):
+        """
+        Read cell values from the first worksheet of an .xlsx workbook.
+        
+        Uses openpyxl's read-only mode, which streams rows without building
+        styles or the full sheet model in memory.
+        
+        Args:
+            file (file): Open binary file object of the workbook
+            
+        Returns:
+            pandas.DataFrame: Parsed import rows
         """
-        Create a question record from a single row of import data.
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, ())
+            df = pd.DataFrame.from_records(list(rows), columns=header)
+        finally:
+            workbook.close()
+        return df[[column for column in df.columns if column in self.IMPORT_COLUMNS]]
+
+    def _prepare_import_rows(self, df):
+        """
+        Normalize import columns and validate every row with column operations.
         
         Args:
-            row (pandas.Series): Data row containing question information
+            df (pandas.DataFrame): Raw rows read from the import file
             
-        Raises:
-            ValidationError: If required data is missing or invalid
-        """
-        question_text = str(row.get('question_text', '')).strip()
-        if not question_text:
-            raise ValidationError("Question text is required")
-        
-        question_type = str(row.get('type', Question.Type.MULTIPLE_CHOICE)).strip().upper()
-        if question_type not in dict(Question.Type.choices):
-            raise ValidationError(f"Invalid question type: {question_type}")
-        
-        points = float(row.get('points', 1.0))
-        if points <= 0:
-            raise ValidationError("Points must be greater than 0")
-        
-        question = Question(
-            question_text=question_text,
-            type=question_type,
-            bank=self.question_bank,
-            points=points,
-            estimated_time=int(row.get('estimated_time', 60)),
-            learning_objective=str(row.get('learning_objective', '')).strip(),
-            created_by=self.uploaded_by,
-            is_active=bool(row.get('is_active', True))
+        Returns:
+            tuple: (rows, errors) where rows holds the normalized question
+            fields in constructor order and errors is a Series with the
+            validation message for each invalid row and NA for valid rows
+        """
+        def column(name):
+            if name in df.columns:
+                return df[name]
+            return pd.Series(pd.NA, index=df.index, dtype='object')
+        
+        def text(name, default=''):
+            return column(name).astype('string').fillna(default).str.strip()
+        
+        def number(name, default):
+            raw = column(name)
+            values = pd.to_numeric(raw, errors='coerce')
+            return values.fillna(default), raw.notna() & values.isna()
+        
+        question_text = text('question_text')
+        
+        # The type column has a handful of distinct labels, so normalize each
+        # label once and carry rows as int8 codes into the valid type list
+        labels = column('type').astype('category')
+        normalized = labels.cat.categories.astype(str).str.strip().str.upper()
+        # Code -1 (missing) selects the appended default type
+        type_labels = np.append(normalized.to_numpy(dtype=object), Question.Type.MULTIPLE_CHOICE)
+        type_names = pd.Series(type_labels[labels.cat.codes.to_numpy()], index=df.index)
+        type_codes = pd.Index(Question.Type.values).get_indexer(type_labels)
+        question_type = pd.Series(
+            pd.Categorical.from_codes(
+                type_codes[labels.cat.codes.to_numpy()],
+                categories=Question.Type.values
+            ),
+            index=df.index
         )
+        points, bad_points = number('points', 1.0)
+        estimated_time, bad_time = number('estimated_time', 60)
+        learning_objective = text('learning_objective')
+        is_active = column('is_active').fillna(True).astype(bool)
         
-        question.full_clean()
-        question.save()
+        # Checks run in order and each row reports the first failure
+        checks = [
+            (question_text.eq(''), "Question text is required"),
+            (question_type.cat.codes < 0, "Invalid question type: " + type_names),
+            (bad_points, "Points must be a number"),
+            (points < Decimal('0.01'), "Points must be at least 0.01"),
+            (bad_time, "Estimated time must be a number"),
+            (estimated_time < 0, "Estimated time cannot be negative"),
+            (learning_objective.str.len() > 300, "Learning objective cannot exceed 300 characters"),
+        ]
+        # np.select picks the first failed check per row in a single pass
+        errors = pd.Series(
+            np.select(
+                [failed.to_numpy(dtype=bool) for failed, _ in checks],
+                [np.asarray(message, dtype=object) for _, message in checks],
+                default=None
+            ),
+            index=df.index,
+            dtype='string'
+        )
+        
+        # Point values repeat heavily, so convert each distinct value to Decimal once
+        decimal_points = {value: Decimal(str(value)) for value in points.unique()}
         
-        return question
+        rows = pd.DataFrame({
+            'question_text': question_text.astype(object),
+            'type': question_type,
+            'points': points.map(decimal_points),
+            'estimated_time': estimated_time.astype('int64'),
+            'learning_objective': learning_objective.astype(object),
+            'is_active': is_active,
+        })
+        return rows, errors
 
     @property
     def success_rate(self):
@@ -175,6 +392,38 @@ class BulkQuestionImport(models.Model):
         return 0
 
 
+IMPORT_TEMPLATE_HEADERS = (
+    'question_text', 'type', 'points', 'estimated_time', 'learning_objective', 'is_active'
+)
+IMPORT_TEMPLATE_SAMPLE_ROW = (
+    'Sample multiple choice question?', 'MC', 1.0, 60, 'Understand basic concepts', True
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_is_shared():
+    """Whether the default cache is visible to other processes, such as cron commands."""
+    return not isinstance(caches['default'], (LocMemCache, DummyCache))
+
+
+def _exam_password_key():
+    """Derive the 32-byte BLAKE2b key used to hash exam passwords."""
+    pepper = getattr(settings, 'EXAM_PASSWORD_PEPPER', settings.SECRET_KEY)
+    return hashlib.blake2b(pepper.encode('utf-8'), digest_size=32).digest()
+
+
+@functools.lru_cache(maxsize=1)
+def _import_template_bytes():
+    """Serialize the bulk question import template once per process."""
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(IMPORT_TEMPLATE_HEADERS)
+    sheet.append(IMPORT_TEMPLATE_SAMPLE_ROW)
+    output = BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
 class QuestionBank(models.Model):
     """
     Repository for organizing and managing assessment questions.
@@ -203,6 +452,10 @@ class QuestionBank(models.Model):
         default=False,
         help_text="Designates whether this question bank is visible to all instructors"
     )
+    active_question_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of active questions in this bank, maintained on question save and delete"
+    )
     created_by = models.ForeignKey(
         User, 
         on_delete=models.CASCADE,
@@ -233,26 +486,12 @@ class QuestionBank(models.Model):
         Returns:
             ContentFile: Excel file containing template structure
         """
-        template_data = {
-            'question_text': ['Sample multiple choice question?'],
-            'type': ['MC'],
-            'points': [1.0],
-            'estimated_time': [60],
-            'learning_objective': ['Understand basic concepts'],
-            'is_active': [True]
-        }
-        
-        df = pd.DataFrame(template_data)
-        output = BytesIO()
-        df.to_excel(output, index=False, engine='openpyxl')
-        output.seek(0)
-        
-        return ContentFile(output.read(), name=f'{self.name}_import_template.xlsx')
+        return ContentFile(_import_template_bytes(), name=f'{self.name}_import_template.xlsx')
 
-    @property
-    def active_questions_count(self):
-        """Return the number of active questions in this bank."""
-        return self.questions.filter(is_active=True).count()
+    def recalculate_active_question_count(self):
+        """Recompute the stored active_question_count from the bank's question rows."""
+        self.active_question_count = self.questions.filter(is_active=True).count()
+        QuestionBank.objects.filter(pk=self.pk).update(active_question_count=self.active_question_count)
 
 
 class Question(models.Model):
@@ -319,12 +558,27 @@ class Question(models.Model):
             models.Index(fields=['created_by', 'is_active']),
             models.Index(fields=['created_at']),
         ]
+        # Enforced by the database so bulk imports can skip full_clean()
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(points__gte=Decimal('0.01')),
+                name='question_points_pos'
+            ),
+        ]
         verbose_name = "Question"
         verbose_name_plural = "Questions"
 
     def __str__(self):
         return f"{self.get_type_display()}: {self.question_text[:100]}..."
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the persisted bank/active pair so saves can adjust bank counts as deltas
+        instance._loaded_bank_id = instance.__dict__.get('bank_id')
+        instance._loaded_is_active = instance.__dict__.get('is_active')
+        return instance
+
     def clean(self):
         """Validate question data integrity and institutional consistency."""
         if self.bank.institution != self.created_by.institution:
@@ -336,6 +590,59 @@ class Question(models.Model):
         return self.type in [self.Type.SHORT_ANSWER, self.Type.ESSAY]
 
 
+class ExamQuerySet(models.QuerySet):
+    """Query helpers for exams."""
+
+    def with_student_access(self, student):
+        """
+        Annotate whether a student is actively enrolled in a section with each exam.
+        
+        The check runs as an EXISTS subquery on the exam fetch itself, so
+        student permission checks need no extra query. The result is
+        available as ``has_access`` on each exam.
+        
+        Args:
+            student (User): Student whose enrollment is checked
+        """
+        return self.annotate(has_access=Exists(Enrollment.objects.filter(
+            student=student,
+            is_active=True,
+            section__exams=OuterRef('pk')
+        )))
+
+    def enrolled(self, student):
+        """
+        Filter to exams assigned to a section the student is actively enrolled in.
+        
+        Enrollment is tested with EXISTS rather than a join, so each exam
+        appears once without DISTINCT.
+        
+        Args:
+            student (User): Student whose enrollments are checked
+        """
+        return self.filter(Exists(Enrollment.objects.filter(
+            student=student,
+            is_active=True,
+            section__exams=OuterRef('pk')
+        )))
+
+    def managed_by(self, educator):
+        """
+        Filter to exams an educator created or that are assigned to a section
+        within the educator's institution.
+        
+        The institution test is an EXISTS subquery, so each exam appears once
+        without DISTINCT.
+        
+        Args:
+            educator (User): Admin or instructor viewing the exams
+        """
+        return self.filter(Q(created_by=educator) | Exists(Section.objects.filter(
+            exams=OuterRef('pk'),
+            course__department__institution_id=educator.institution_id
+        )))
+
+
 class Exam(models.Model):
     """
     Comprehensive exam definition and configuration model.
@@ -382,12 +689,21 @@ class Exam(models.Model):
         validators=[MinValueValidator(0), MaxValueValidator(100)],
         help_text="Minimum score percentage required to pass the exam"
     )
+    total_points = models.DecimalField(
+        max_digits=8,
+        decimal_places=2,
+        default=0,
+        editable=False,
+        help_text="Total possible points, maintained from exam question point values"
+    )
     
     # Exam Security
-    exam_password = models.CharField(
-        max_length=100,
+    exam_password_hash = models.BinaryField(
+        max_length=32,
         blank=True,
-        help_text="Optional password required for exam access"
+        default=b'',
+        editable=False,
+        help_text="Keyed hash of the optional password required for exam access"
     )
     
     # Scheduling
@@ -448,11 +764,14 @@ class Exam(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ExamQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['status', 'created_by']),
             models.Index(fields=['start_date', 'end_date']),
+            models.Index(fields=['status', 'start_date', 'end_date'], name='exam_status_window_idx'),
             models.Index(fields=['created_at']),
         ]
         verbose_name = "Exam"
@@ -461,27 +780,130 @@ class Exam(models.Model):
     def __str__(self):
         return self.title
 
-    @property
+    @cached_property
     def is_active(self):
         """
         Determine if exam is currently available based on schedule and status.
         
+        Evaluated once per instance, so permission checks and templates in
+        the same request agree on the answer.
+        
+        Returns:
+            bool: True if exam is live and within scheduled timeframe
+        """
+        return self.is_active_at(timezone.now())
+
+    def is_active_at(self, now):
+        """
+        Determine if exam is available at the given moment.
+        
+        Args:
+            now (datetime): Reference time, typically captured once per request
+            
         Returns:
             bool: True if exam is live and within scheduled timeframe
         """
-        now = timezone.now()
         return (self.status == self.Status.LIVE and 
                 self.start_date <= now <= self.end_date)
 
+    INSTITUTION_CACHE_TIMEOUT = 60
+    INSTITUTION_VERSION_KEY = 'exam:institution:version'
+
+    @classmethod
+    def ids_for_institution(cls, institution_id):
+        """
+        Return the ids of exams assigned to sections within an institution.
+        
+        Educator permission checks run on most exam pages, so the set is
+        cached per institution. Keys embed a shared version number that is
+        bumped whenever section assignments or the course hierarchy change.
+        
+        Args:
+            institution_id (int): Institution to look up
+            
+        Returns:
+            set: Primary keys of the institution's exams
+        """
+        version = cache.get_or_set(cls.INSTITUTION_VERSION_KEY, 1, None)
+        return cache.get_or_set(
+            f'exam:institution:{version}:{institution_id}',
+            lambda: set(cls.objects.filter(
+                sections__course__department__institution_id=institution_id
+            ).values_list('pk', flat=True)),
+            cls.INSTITUTION_CACHE_TIMEOUT
+        )
+
+    QUESTION_ORDER_CACHE_TIMEOUT = 300
+
+    @staticmethod
+    def question_order_cache_key(exam_id):
+        """Return the cache key holding an exam's ordered question ids."""
+        return f'exam:question_order:{exam_id}'
+
+    @classmethod
+    def ordered_question_ids(cls, exam_id):
+        """
+        Return an exam's questions in display order, cached between requests.
+        
+        Only ids and positions are cached, so edits to question content are
+        picked up immediately; the cache is cleared whenever an exam question
+        is saved or deleted.
+        
+        Args:
+            exam_id (int): Exam to look up
+            
+        Returns:
+            list: (question_id, order) tuples sorted by order
+        """
+        return cache.get_or_set(
+            cls.question_order_cache_key(exam_id),
+            lambda: list(ExamQuestion.objects.filter(exam_id=exam_id).order_by(
+                'order'
+            ).values_list('question_id', 'order')),
+            cls.QUESTION_ORDER_CACHE_TIMEOUT
+        )
+
     @property
     def requires_password(self):
         """
         Check if exam requires password authentication.
         
         Returns:
-            bool: True if exam password is set and not empty
+            bool: True if an exam password has been set
         """
-        return bool(self.exam_password.strip())
+        return bool(self.exam_password_hash)
+
+    @staticmethod
+    def hash_exam_password(password):
+        """
+        Return the keyed BLAKE2b digest stored for an exam password.
+        
+        The key is derived from settings.EXAM_PASSWORD_PEPPER, so changing the
+        pepper invalidates every stored exam password.
+        
+        Args:
+            password (str): Plaintext exam password
+            
+        Returns:
+            bytes: 32-byte digest
+        """
+        return hashlib.blake2b(
+            password.encode('utf-8'),
+            key=_exam_password_key(),
+            digest_size=32
+        ).digest()
+
+    def set_exam_password(self, password):
+        """
+        Set or clear the exam password.
+        
+        Args:
+            password (str): New plaintext password; blank clears the requirement
+        """
+        if password and not password.isspace():
+            self.exam_password_hash = self.hash_exam_password(password)
+        else:
+            self.exam_password_hash = b''
 
     def validate_password(self, password_attempt):
         """
@@ -495,7 +917,11 @@ class Exam(models.Model):
         """
         if not self.requires_password:
             return True
-        return self.exam_password == password_attempt
+        # Constant-time comparison so response timing does not leak the digest
+        return hmac.compare_digest(
+            bytes(self.exam_password_hash),
+            self.hash_exam_password(password_attempt or '')
+        )
 
     def clean(self):
         """Validate exam configuration integrity and scheduling logic."""
@@ -505,12 +931,12 @@ class Exam(models.Model):
         if self.pass_percentage > 100:
             raise ValidationError("Pass percentage cannot exceed 100%.")
 
-    @property
-    def total_points(self):
-        """Calculate total possible points for the exam."""
-        return sum(
-            eq.points for eq in self.exam_questions.select_related('question').all()
-        )
+    def recalculate_total_points(self):
+        """Recompute the stored total_points from the exam's question rows."""
+        self.total_points = self.exam_questions.aggregate(
+            total=models.Sum('points')
+        )['total'] or 0
+        Exam.objects.filter(pk=self.pk).update(total_points=self.total_points)
 
 
 class ExamQuestion(models.Model):
@@ -554,10 +980,84 @@ class ExamQuestion(models.Model):
     def __str__(self):
         return f"{self.exam.title} - Question {self.order}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember persisted values so point changes can be applied to the exam as deltas
+        loaded = dict(zip(field_names, values))
+        instance._loaded_exam_id = loaded.get('exam_id')
+        instance._loaded_points = loaded.get('points')
+        return instance
+
     def clean(self):
         """Validate question point value integrity."""
-        if self.points <= 0:
-            raise ValidationError("Question points must be greater than zero.")
+        if self.points is not None and self.points < Decimal('0.01'):
+            raise ValidationError("Question points must be at least 0.01.")
+
+
+class ExamAttemptQuerySet(models.QuerySet):
+    """Query helpers for exam attempts."""
+
+    def with_runtime_refs(self):
+        """
+        Join the relations read by the attempt runtime properties.
+        
+        time_remaining and requires_password_input read the exam,
+        can_access_from_device reads the device session and most views
+        display the student, so fetch all three alongside the attempt.
+        """
+        return self.select_related('exam', 'device_session', 'student')
+
+    def with_timer_refs(self):
+        """
+        Join the exam and load only what the exam-taking loop reads.
+        
+        Covers the status and timing fields behind time_remaining_at and
+        requires_password_input, plus the keys start_exam and the attempt
+        save signals use, so navigating between questions fetches one
+        narrow row instead of the attempt, exam, device session and student.
+        """
+        return self.select_related('exam').only(
+            'status', 'start_time', 'end_time', 'student_id', 'exam_id',
+            'device_session_id', 'session_token',
+            'exam__duration', 'exam__exam_password_hash'
+        )
+
+    def with_scores(self):
+        """
+        Annotate each attempt's score computed in the database.
+        
+        ``score`` is the sum of points awarded across the attempt's responses,
+        ``max_score`` the exam's total points and ``percentage`` the score as
+        a percentage of the total (NULL when the exam has no points).
+        """
+        points = QuestionResponse.objects.filter(
+            attempt=OuterRef('pk')
+        ).order_by().values('attempt').annotate(total=Sum('points_awarded')).values('total')
+        score_field = models.DecimalField(max_digits=8, decimal_places=2)
+        return self.annotate(
+            score=Coalesce(Subquery(points), Value(Decimal('0')), output_field=score_field),
+            max_score=F('exam__total_points'),
+            percentage=ExpressionWrapper(
+                F('score') * 100 / NullIf(F('exam__total_points'), Value(Decimal('0'))),
+                output_field=score_field
+            )
+        )
+
+    def with_event_timeline(self, limit=200):
+        """
+        Prefetch the most recent monitoring events for the proctor timeline.
+        
+        Only the columns the timeline shows are loaded, and at most ``limit``
+        events per attempt, newest first. The events are available as the
+        ``recent_monitoring_events`` list on each attempt.
+        """
+        events = MonitoringEvent.objects.select_related(None).only(
+            'id', 'attempt', 'event_type', 'severity', 'timestamp', 'reviewed_status'
+        ).order_by('-timestamp')[:limit]
+        return self.prefetch_related(
+            models.Prefetch('monitoring_events', queryset=events, to_attr='recent_monitoring_events')
+        )
 
 
 class ExamAttempt(models.Model):
@@ -655,15 +1155,38 @@ class ExamAttempt(models.Model):
         help_text="Timestamp of most recent password attempt"
     )
 
+    # Monitoring summary maintained from MonitoringEvent writes
+    pending_events_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of monitoring events awaiting review"
+    )
+    max_pending_severity = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Highest severity among monitoring events awaiting review"
+    )
+
+    objects = ExamAttemptQuerySet.as_manager()
+
     class Meta:
         unique_together = ['exam', 'student']
         ordering = ['-start_time']
         indexes = [
-            models.Index(fields=['exam', 'student', 'status']),
+            models.Index(
+                fields=['exam', 'student', 'status', 'start_time', 'device_session', 'session_token'],
+                name='examattempt_cover_idx'
+            ),
             models.Index(fields=['student', 'status']),
+            models.Index(fields=['exam', 'status'], name='attempt_exam_status_idx'),
+            models.Index(fields=['status', 'start_time'], name='attempt_status_start_idx'),
             models.Index(fields=['device_session']),
             models.Index(fields=['session_token']),
             models.Index(fields=['start_time']),
+            models.Index(
+                fields=['-max_pending_severity', '-pending_events_count'],
+                name='attempt_pending_events_idx'
+            ),
         ]
         verbose_name = "Exam Attempt"
         verbose_name_plural = "Exam Attempts"
@@ -671,52 +1194,119 @@ class ExamAttempt(models.Model):
     def __str__(self):
         return f"{self.student.email} - {self.exam.title} - {self.get_status_display()}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the persisted device/status pair so saves that leave an
+        # in-progress attempt on the same device can skip revalidation
+        instance._validated_device = (
+            instance.__dict__.get('device_session_id'),
+            instance.__dict__.get('status'),
+        )
+        return instance
+
+    @property
+    def event_risk_level(self):
+        """Risk level derived from the pending monitoring event summary."""
+        if self.max_pending_severity >= 8:
+            return 'high'
+        if self.pending_events_count > 1:
+            return 'medium'
+        return 'low'
+
+    @classmethod
+    def add_pending_events(cls, attempt_id, count, severity):
+        """
+        Fold newly logged pending monitoring events into an attempt's summary.
+        
+        Args:
+            attempt_id (int): Attempt the events belong to
+            count (int): Number of new pending events
+            severity (int): Highest severity among the new events
+        """
+        cls.objects.filter(pk=attempt_id).update(
+            pending_events_count=F('pending_events_count') + count,
+            max_pending_severity=Greatest('max_pending_severity', Value(severity))
+        )
+
+    @classmethod
+    def refresh_pending_events(cls, attempt_ids):
+        """
+        Recompute the pending monitoring event summary for the given attempts.
+        
+        Used when events leave the pending state or are removed, since the
+        highest remaining severity cannot be derived incrementally.
+        
+        Args:
+            attempt_ids (iterable): Primary keys of the attempts to refresh
+        """
+        attempt_ids = list(attempt_ids)
+        if not attempt_ids:
+            return
+        pending = MonitoringEvent._base_manager.filter(
+            attempt=OuterRef('pk'),
+            reviewed_status=MonitoringEvent.ReviewedStatus.PENDING
+        ).order_by().values('attempt')
+        cls.objects.filter(pk__in=attempt_ids).update(
+            pending_events_count=Coalesce(
+                Subquery(pending.annotate(n=Count('pk')).values('n')), 0
+            ),
+            max_pending_severity=Coalesce(
+                Subquery(pending.annotate(m=Max('severity')).values('m')), 0
+            )
+        )
+
     def clean(self):
         """Validate attempt integrity and prevent multiple active sessions."""
-        if self.status == self.Status.IN_PROGRESS and self.device_session:
-            # Check for existing active sessions for this user+exam
-            active_sessions = ActiveExamSession.objects.filter(
-                user=self.student, 
-                exam=self.exam, 
+        if self.status == self.Status.IN_PROGRESS and self.device_session_id:
+            # Check for existing active sessions for this user+exam, filtering on
+            # the raw foreign keys so the related rows are never fetched
+            other_session = ActiveExamSession.objects.filter(
+                user_id=self.student_id,
+                exam_id=self.exam_id,
                 is_active=True
-            ).exclude(attempt=self)
-            
-            if active_sessions.exists():
-                other_session = active_sessions.first()
+            ).exclude(attempt_id=self.pk).values('started_at').first()
+
+            if other_session is not None:
                 raise ValidationError(
                     f"Active exam session already exists started at "
-                    f"{other_session.started_at.strftime('%Y-%m-%d %H:%M')}"
+                    f"{other_session['started_at'].strftime('%Y-%m-%d %H:%M')}"
                 )
 
-    def start_exam(self, device_session, password_attempt=None):
+    def start_exam(self, device_session, password_attempt=None, now=None):
         """
         Initiate exam attempt with password validation and device registration.
         
         Args:
             device_session (UserDeviceSession): Validated device session
             password_attempt (str, optional): Password for exam access
+            now (datetime, optional): Request timestamp, defaults to the current time
             
         Returns:
             tuple: (success: bool, message: str)
         """
-        if self.exam.requires_password:
+        now = now or timezone.now()
+        exam = self.exam
+        if exam.requires_password:
             if not password_attempt:
                 self.status = self.Status.PASSWORD_REQUIRED
-                self.save()
+                self.save(update_fields=['status'])
                 return False, "Password required to start exam"
             
-            if not self.exam.validate_password(password_attempt):
+            if not exam.validate_password(password_attempt):
                 self.password_attempts += 1
-                self.last_password_attempt = timezone.now()
-                self.save()
+                self.last_password_attempt = now
+                self.save(update_fields=['password_attempts', 'last_password_attempt'])
                 return False, "Incorrect exam password"
         
         # Password validated or not required - start exam
         self.status = self.Status.IN_PROGRESS
-        self.start_time = timezone.now()
+        self.start_time = now
         self.device_session = device_session
         self.session_token = uuid.uuid4()
-        self.save()
+        self.save(update_fields=[
+            'status', 'start_time', 'device_session', 'session_token'
+        ])
         return True, "Exam started successfully"
 
     def terminate_session(self, reason="Multiple device access detected"):
@@ -729,7 +1319,7 @@ class ExamAttempt(models.Model):
         self.status = self.Status.TERMINATED
         self.termination_reason = reason
         self.end_time = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'termination_reason', 'end_time'])
         
         # Deactivate any active session
         ActiveExamSession.objects.filter(
@@ -771,15 +1361,81 @@ class ExamAttempt(models.Model):
         """
         Calculate remaining time for in-progress attempts.
         
+        Returns:
+            float: Remaining time in seconds or 0 if not in progress
+        """
+        return self.time_remaining_at(timezone.now())
+
+    def time_remaining_at(self, now):
+        """
+        Calculate remaining time for in-progress attempts at the given moment.
+        
+        Args:
+            now (datetime): Reference time, typically captured once per request
+            
         Returns:
             float: Remaining time in seconds or 0 if not in progress
         """
         if self.status == self.Status.IN_PROGRESS and self.start_time:
-            elapsed = (timezone.now() - self.start_time).total_seconds()
-            remaining = (self.exam.duration * 60) - elapsed
-            return max(0, remaining)
+            deadline = self.start_time + timedelta(minutes=self.exam.duration)
+            return max(0, (deadline - now).total_seconds())
         return 0
 
+    TIMER_CACHE_GRACE = 60
+    # Invalidation only reaches the local process with a process-local cache,
+    # so other workers may serve a stale timer for at most this many seconds
+    TIMER_LOCAL_CACHE_TIMEOUT = 5
+
+    @staticmethod
+    def timer_cache_key(attempt_id):
+        """Return the cache key holding the timer state for an attempt."""
+        return f'attempt:timer:{attempt_id}'
+
+    def cache_timer(self):
+        """
+        Cache the state the exam timer needs so polls can skip the database.
+        
+        In-progress attempts are cached until their deadline passes; other
+        states only briefly, since the page redirects away from the timer.
+        The cached state only drives the countdown display; paths that
+        accept answers check the attempt row itself.
+        
+        Returns:
+            tuple: (deadline timestamp or None, status, student_id)
+        """
+        deadline = None
+        timeout = self.TIMER_CACHE_GRACE
+        if self.status == self.Status.IN_PROGRESS and self.start_time:
+            deadline = (self.start_time + timedelta(minutes=self.exam.duration)).timestamp()
+            timeout += max(0, deadline - timezone.now().timestamp())
+        if not _cache_is_shared():
+            timeout = min(timeout, self.TIMER_LOCAL_CACHE_TIMEOUT)
+        timer = (deadline, self.status, self.student_id)
+        cache.set(self.timer_cache_key(self.pk), timer, timeout)
+        return timer
+
+    @classmethod
+    def get_timer(cls, attempt_id):
+        """
+        Return an attempt's timer state, loading and caching it on a miss.
+        
+        Args:
+            attempt_id (int): Primary key of the attempt
+            
+        Returns:
+            tuple: (deadline timestamp or None, status, student_id), or None
+            if the attempt does not exist
+        """
+        timer = cache.get(cls.timer_cache_key(attempt_id))
+        if timer is None:
+            attempt = cls.objects.select_related('exam').only(
+                'status', 'start_time', 'student_id', 'exam__duration'
+            ).filter(pk=attempt_id).first()
+            if attempt is None:
+                return None
+            timer = attempt.cache_timer()
+        return timer
+
     @property
     def requires_password_input(self):
         """
@@ -848,13 +1504,20 @@ class QuestionResponse(models.Model):
         default=False,
         help_text="Designates whether this response has been formally submitted"
     )
+    order = models.PositiveIntegerField(
+        default=0,
+        help_text="Position of the question in the exam, copied from ExamQuestion.order"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ['attempt', 'question']
+        constraints = [
+            # Also serves (attempt, question) lookups and the answer upsert's conflict target
+            models.UniqueConstraint(fields=['attempt', 'question'], name='uniq_resp'),
+        ]
         indexes = [
-            models.Index(fields=['attempt', 'question']),
+            models.Index(fields=['attempt', 'order'], name='qr_attempt_order_idx'),
             models.Index(fields=['last_auto_save']),
             models.Index(fields=['created_at']),
         ]
@@ -893,6 +1556,29 @@ class QuestionResponse(models.Model):
             'student_answer', 'draft_answer', 'is_submitted', 'updated_at'
         ])
 
+    @classmethod
+    def record_answer(cls, attempt, question, answer_data, order=None):
+        """
+        Create or overwrite the answer for a question in a single statement.
+        
+        Args:
+            attempt (ExamAttempt): Attempt being answered
+            question (Question): Question being answered
+            answer_data: Response data to store
+            order (int, optional): The question's position in the exam; looked
+                up from ExamQuestion when not supplied
+        """
+        if order is None:
+            order = ExamQuestion.objects.filter(
+                exam_id=attempt.exam_id, question=question
+            ).values_list('order', flat=True).first() or 0
+        cls.objects.bulk_create(
+            [cls(attempt=attempt, question=question, student_answer=answer_data, order=order)],
+            update_conflicts=True,
+            unique_fields=['attempt', 'question'],
+            update_fields=['student_answer', 'updated_at']
+        )
+
     @property
     def has_draft(self):
         """Check if response has unsaved draft data."""
@@ -904,6 +1590,46 @@ class QuestionResponse(models.Model):
         return self.points_awarded is not None
 
 
+MAX_EVIDENCE_BYTES = 4096
+
+
+def validate_evidence_size(value):
+    """
+    Reject monitoring evidence payloads larger than MAX_EVIDENCE_BYTES.
+    
+    Evidence should hold structured metadata only; screenshots and recordings
+    belong in file storage and are referenced from the evidence by path or URL.
+    """
+    size = len(json.dumps(value, separators=(',', ':')).encode('utf-8'))
+    if size > MAX_EVIDENCE_BYTES:
+        raise ValidationError(
+            f"Evidence payload is {size} bytes; the limit is {MAX_EVIDENCE_BYTES} bytes."
+        )
+
+
+class MonitoringEventManager(models.Manager):
+    """Default manager for monitoring events."""
+
+    # Bulky columns only the review page needs
+    DETAIL_FIELDS = ('evidence', 'review_notes', 'action_taken')
+
+    def get_queryset(self):
+        """
+        Join the relations shown when listing events and defer detail columns.
+        
+        Event lists and __str__ display the attempt with its student and exam,
+        along with the reviewer, so fetch them alongside each event. Evidence
+        and review text are left unloaded until accessed.
+        """
+        return self.with_details().defer(*self.DETAIL_FIELDS)
+
+    def with_details(self):
+        """Return events with every column loaded, for review and detail pages."""
+        return super().get_queryset().select_related(
+            'attempt__student', 'attempt__exam', 'reviewed_by'
+        )
+
+
 class MonitoringEvent(models.Model):
     """
     Tracks security and proctoring events during exam attempts.
@@ -943,14 +1669,30 @@ class MonitoringEvent(models.Model):
         auto_now_add=True,
         help_text="Exact time when event was detected"
     )
-    severity = models.PositiveIntegerField(
+    severity = models.PositiveSmallIntegerField(
         default=5,
         validators=[MinValueValidator(1), MaxValueValidator(10)],
         help_text="Severity level from 1 (low) to 10 (critical)"
     )
     evidence = models.JSONField(
         default=dict,
-        help_text="Supporting evidence and contextual data for the event"
+        validators=[validate_evidence_size],
+        help_text="Supporting evidence and contextual data for the event; large media is stored separately and referenced here"
+    )
+    face_count = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="Number of faces detected in the webcam frame"
+    )
+    voice_db = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="Detected voice level in decibels"
+    )
+    tab_switches = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="Number of tab or window switches reported by the client"
     )
     description = models.TextField(
         blank=True,
@@ -967,7 +1709,7 @@ class MonitoringEvent(models.Model):
         null=True, 
         blank=True, 
         on_delete=models.SET_NULL,
-        limit_choices_to={'role__in': [User.Role.ADMIN, User.Role.INSTRUCTOR]},
+        limit_choices_to={'is_reviewer': True},
         help_text="Staff member who reviewed this event"
     )
     reviewed_at = models.DateTimeField(
@@ -983,14 +1725,64 @@ class MonitoringEvent(models.Model):
         blank=True, 
         help_text="Actions taken based on this event assessment"
     )
+    requires_immediate_attention = models.GeneratedField(
+        expression=models.Q(severity__gte=8),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        help_text="Whether event severity warrants immediate action"
+    )
+    is_resolved = models.GeneratedField(
+        expression=models.Q(reviewed_status__in=[
+            ReviewedStatus.APPROVED,
+            ReviewedStatus.VIOLATION,
+            ReviewedStatus.FALSE_ALARM
+        ]),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        help_text="Whether the event has been fully reviewed and addressed"
+    )
+
+    objects = MonitoringEventManager()
+
+    COPY_INGEST_THRESHOLD = 100
+
+    # Evidence keys stored in their own columns so dashboards avoid JSON extraction
+    EVIDENCE_FACETS = ('face_count', 'voice_db', 'tab_switches')
 
     class Meta:
         ordering = ['-timestamp']
         indexes = [
             models.Index(fields=['attempt', 'event_type', 'reviewed_status']),
             models.Index(fields=['timestamp']),
-            models.Index(fields=['reviewed_status']),
-            models.Index(fields=['severity']),
+            models.Index(
+                fields=['reviewed_status', '-severity', '-timestamp'],
+                name='me_status_sev_ts_idx'
+            ),
+            models.Index(
+                fields=['-timestamp'],
+                condition=models.Q(reviewed_status='PENDING', severity__gte=8),
+                name='me_pending_hi_idx'
+            ),
+            models.Index(
+                fields=['timestamp'],
+                condition=models.Q(requires_immediate_attention=True),
+                name='me_urgent_idx'
+            ),
+            models.Index(
+                fields=['face_count'],
+                condition=models.Q(face_count__isnull=False),
+                name='me_face_count_idx'
+            ),
+            models.Index(
+                fields=['voice_db'],
+                condition=models.Q(voice_db__isnull=False),
+                name='me_voice_db_idx'
+            ),
+            models.Index(
+                fields=['tab_switches'],
+                condition=models.Q(tab_switches__isnull=False),
+                name='me_tab_switches_idx'
+            ),
         ]
         verbose_name = "Monitoring Event"
         verbose_name_plural = "Monitoring Events"
@@ -998,6 +1790,37 @@ class MonitoringEvent(models.Model):
     def __str__(self):
         return f"{self.get_event_type_display()} - {self.attempt}"
 
+    @classmethod
+    def split_evidence(cls, evidence):
+        """
+        Separate the numeric facets reviewers filter on from free-form evidence.
+        
+        Args:
+            evidence (dict): Raw evidence payload reported by the client
+            
+        Returns:
+            tuple: (facet field values, remaining evidence)
+        """
+        facets = {}
+        overflow = dict(evidence)
+        for field in cls.EVIDENCE_FACETS:
+            value = overflow.get(field)
+            # Values that do not fit a smallint column stay in the evidence
+            if isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 32767:
+                facets[field] = overflow.pop(field)
+        return facets, overflow
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded review state so saves can tell whether the
+        # attempt's pending event summary needs refreshing
+        instance._loaded_pending = (
+            instance.__dict__.get('reviewed_status') == cls.ReviewedStatus.PENDING
+        )
+        instance._loaded_severity = instance.__dict__.get('severity')
+        return instance
+
     def assign_for_review(self, assigned_to):
         """
         Assign event for review to designated staff member.
@@ -1007,7 +1830,7 @@ class MonitoringEvent(models.Model):
         """
         self.reviewed_status = self.ReviewedStatus.REVIEWING
         self.reviewed_by = assigned_to
-        self.save(update_fields=['reviewed_status', 'reviewed_by'])
+        self.bulk_assign_for_review([self.pk], assigned_to)
 
     def complete_review(self, status, notes="", action_taken=""):
         """
@@ -1022,23 +1845,122 @@ class MonitoringEvent(models.Model):
         self.review_notes = notes
         self.action_taken = action_taken
         self.reviewed_at = timezone.now()
-        self.save(update_fields=[
-            'reviewed_status', 'review_notes', 'action_taken', 'reviewed_at'
-        ])
+        self.bulk_complete_review(
+            [self.pk], status, notes, action_taken, reviewed_at=self.reviewed_at
+        )
 
-    @property
-    def requires_immediate_attention(self):
-        """Check if event severity warrants immediate action."""
-        return self.severity >= 8
+    @classmethod
+    def bulk_log(cls, events, batch_size=500):
+        """
+        Persist a burst of monitoring events with batched INSERT statements.
+        
+        Args:
+            events (list): Unsaved MonitoringEvent instances
+            batch_size (int): Maximum number of rows per INSERT
+            
+        Returns:
+            list: The created events
+        """
+        created = cls.objects.bulk_create(events, batch_size=batch_size)
+        cls._record_pending_events(created)
+        return created
 
-    @property
-    def is_resolved(self):
-        """Check if event has been fully reviewed and addressed."""
-        return self.reviewed_status in [
-            self.ReviewedStatus.APPROVED,
-            self.ReviewedStatus.VIOLATION,
-            self.ReviewedStatus.FALSE_ALARM
-        ]
+    @classmethod
+    def bulk_ingest(cls, events):
+        """
+        Persist client telemetry uploads, using COPY for large batches.
+        
+        Batches of at least COPY_INGEST_THRESHOLD events are loaded with
+        django-bulk-load when it is installed and the database is PostgreSQL;
+        everything else goes through bulk_log.
+        
+        Telemetry is retransmitted by clients, so on PostgreSQL the ingest
+        transaction commits without waiting for the WAL flush.
+        
+        Args:
+            events (list): Unsaved MonitoringEvent instances
+            
+        Returns:
+            list: The ingested events
+        """
+        is_postgresql = connection.vendor == 'postgresql'
+        with transaction.atomic():
+            if is_postgresql:
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL synchronous_commit = OFF")
+            
+            if (
+                bulk_insert_models is None
+                or not is_postgresql
+                or len(events) < cls.COPY_INGEST_THRESHOLD
+            ):
+                return cls.bulk_log(events)
+            
+            now = timezone.now()
+            for event in events:
+                if event.timestamp is None:
+                    event.timestamp = now
+            bulk_insert_models(events)
+            cls._record_pending_events(events)
+            return events
+
+    @classmethod
+    def _record_pending_events(cls, events):
+        """Fold bulk-inserted pending events into each attempt's summary, since signals are skipped."""
+        pending = {}
+        for event in events:
+            if event.reviewed_status == cls.ReviewedStatus.PENDING:
+                count, severity = pending.get(event.attempt_id, (0, 0))
+                pending[event.attempt_id] = (count + 1, max(severity, event.severity))
+        for attempt_id, (count, severity) in pending.items():
+            ExamAttempt.add_pending_events(attempt_id, count, severity)
+
+    @classmethod
+    def bulk_assign_for_review(cls, event_ids, assigned_to):
+        """
+        Assign several events for review in a single UPDATE.
+        
+        Args:
+            event_ids (list): Primary keys of the events to assign
+            assigned_to (User): Staff member responsible for review
+            
+        Returns:
+            int: Number of events updated
+        """
+        events = cls.objects.filter(pk__in=event_ids)
+        attempt_ids = set(events.values_list('attempt_id', flat=True))
+        updated = events.update(
+            reviewed_status=cls.ReviewedStatus.REVIEWING,
+            reviewed_by=assigned_to
+        )
+        ExamAttempt.refresh_pending_events(attempt_ids)
+        return updated
+
+    @classmethod
+    def bulk_complete_review(cls, event_ids, status, notes="", action_taken="", reviewed_at=None):
+        """
+        Complete the review of several events in a single UPDATE.
+        
+        Args:
+            event_ids (list): Primary keys of the reviewed events
+            status (str): Final review status
+            notes (str): Review notes and observations
+            action_taken (str): Actions implemented based on review
+            reviewed_at (datetime, optional): Review time, defaults to now
+            
+        Returns:
+            int: Number of events updated
+        """
+        events = cls.objects.filter(pk__in=event_ids)
+        attempt_ids = set(events.values_list('attempt_id', flat=True))
+        updated = events.update(
+            reviewed_status=status,
+            review_notes=notes,
+            action_taken=action_taken,
+            reviewed_at=reviewed_at or timezone.now()
+        )
+        ExamAttempt.refresh_pending_events(attempt_ids)
+        return updated
 
 
 class ActiveExamSession(models.Model):
@@ -1081,8 +2003,8 @@ class ActiveExamSession(models.Model):
         help_text="Timestamp when the session started"
     )
     last_activity = models.DateTimeField(
-        auto_now=True,
-        help_text="Timestamp of the last activity in this session"
+        default=timezone.now,
+        help_text="Timestamp of the last activity in this session, flushed periodically from the cache"
     )
     is_active = models.BooleanField(
         default=True,
@@ -1100,8 +2022,12 @@ class ActiveExamSession(models.Model):
         indexes = [
             models.Index(fields=['user', 'exam']),
             models.Index(fields=['session_token']),
-            models.Index(fields=['is_active']),
             models.Index(fields=['risk_level']),
+            models.Index(
+                fields=['risk_level', '-last_activity', 'user', 'exam', 'attempt'],
+                condition=models.Q(is_active=True),
+                name='aes_active_covering'
+            ),
         ]
         verbose_name = "Active Exam Session"
         verbose_name_plural = "Active Exam Sessions"
@@ -1114,6 +2040,87 @@ class ActiveExamSession(models.Model):
         """Calculate the duration of the active session in minutes."""
         return (timezone.now() - self.started_at).total_seconds() / 60
 
+    ACTIVITY_CACHE_TIMEOUT = 600
+    # Minimum seconds between direct last_activity writes when the cache is process-local
+    ACTIVITY_WRITE_INTERVAL = 60
+
+    @staticmethod
+    def activity_cache_key(session_token):
+        """Return the cache key holding the pending last activity for a session token."""
+        return f'aes:last_activity:{session_token}'
+
+    @classmethod
+    def record_activity(cls, session_token, timestamp=None):
+        """
+        Record session activity without writing the row on every heartbeat.
+        
+        With a cache shared between processes the timestamp is buffered there
+        and persisted in bulk by flush_cached_activity. A process-local cache
+        is invisible to the flush command, so the row is updated directly
+        instead, at most once per ACTIVITY_WRITE_INTERVAL.
+        
+        Args:
+            session_token (UUID): Token of the active session
+            timestamp (datetime, optional): Activity time, defaults to now
+        """
+        timestamp = timestamp or timezone.now()
+        if not _cache_is_shared():
+            cls.objects.filter(
+                session_token=session_token,
+                last_activity__lt=timestamp - timedelta(seconds=cls.ACTIVITY_WRITE_INTERVAL)
+            ).update(last_activity=timestamp)
+            return
+        cache.set(
+            cls.activity_cache_key(session_token),
+            timestamp.timestamp(),
+            cls.ACTIVITY_CACHE_TIMEOUT
+        )
+
+    def touch(self):
+        """Record activity for this session in the cache."""
+        self.record_activity(self.session_token)
+
+    @classmethod
+    def flush_cached_activity(cls):
+        """
+        Persist cached activity timestamps for active sessions in one bulk update.
+        
+        Entries are left to expire rather than deleted, so a heartbeat racing
+        with the flush is never lost; a timestamp is only written when it is
+        newer than the stored one.
+        
+        Returns:
+            int: Number of sessions whose last_activity was updated
+        """
+        sessions = list(cls.objects.filter(is_active=True).only('pk', 'session_token', 'last_activity'))
+        keys = {cls.activity_cache_key(session.session_token): session for session in sessions}
+        cached = cache.get_many(keys)
+        
+        updated = []
+        for key, ts in cached.items():
+            session = keys[key]
+            activity = datetime.fromtimestamp(ts, tz=dt_timezone.utc)
+            if activity > session.last_activity:
+                session.last_activity = activity
+                updated.append(session)
+        
+        if updated:
+            cls.objects.bulk_update(updated, ['last_activity'], batch_size=500)
+        return len(updated)
+
+    @classmethod
+    def bulk_deactivate_for_exam(cls, exam_id):
+        """
+        Deactivate every active session of an exam in a single UPDATE.
+        
+        Args:
+            exam_id (int): Primary key of the exam being closed
+            
+        Returns:
+            int: Number of sessions deactivated
+        """
+        return cls.objects.filter(exam_id=exam_id, is_active=True).update(is_active=False)
+
     def update_risk_level(self, new_risk_level):
         """
         Update the risk level for this session.
@@ -1131,6 +2138,9 @@ class ActiveExamSession(models.Model):
         self.save(update_fields=['is_active'])
 
 
+# ExamAttempt fields that determine the state of its ActiveExamSession
+ACTIVE_SESSION_SOURCE_FIELDS = frozenset({'status', 'device_session', 'session_token'})
+
 # Signal Handlers for Automated System Management
 @receiver(pre_save, sender=ExamAttempt)
 def validate_single_device_access(sender, instance, **kwargs):
@@ -1138,32 +2148,206 @@ def validate_single_device_access(sender, instance, **kwargs):
     Prevent multiple device access for the same exam attempt.
     Ensures concurrency control integrity before attempt persistence.
     """
-    if instance.status == ExamAttempt.Status.IN_PROGRESS:
+    if instance.status != ExamAttempt.Status.IN_PROGRESS:
+        return
+    
+    # An attempt already in progress on the same device passed this check
+    # when it started, so autosaves and heartbeats can skip the query
+    current = (instance.device_session_id, instance.status)
+    if instance.pk is None or getattr(instance, '_validated_device', None) != current:
         instance.clean()
+        instance._validated_device = current
 
 
 @receiver(post_save, sender=ExamAttempt)
-def manage_active_sessions(sender, instance, created, **kwargs):
+def manage_active_sessions(sender, instance, created, update_fields=None, **kwargs):
     """
     Manage active exam sessions when attempt status changes.
     Synchronizes session state with attempt lifecycle events.
     """
-    if instance.status == ExamAttempt.Status.IN_PROGRESS and instance.device_session:
-        # Create or update active session
-        ActiveExamSession.objects.update_or_create(
-            user=instance.student,
-            exam=instance.exam,
-            defaults={
-                'device_session': instance.device_session,
-                'attempt': instance,
-                'session_token': instance.session_token or uuid.uuid4(),
-                'is_active': True,
-                'last_activity': timezone.now()
-            }
+    # Partial saves that leave the session-related fields alone cannot change
+    # the active session, so skip the write entirely
+    if update_fields is not None and not ACTIVE_SESSION_SOURCE_FIELDS.intersection(update_fields):
+        return
+    
+    if instance.status == ExamAttempt.Status.IN_PROGRESS and instance.device_session_id:
+        session_token = instance.session_token or uuid.uuid4()
+        # Create or update active session in a single upsert statement
+        ActiveExamSession.objects.bulk_create(
+            [
+                ActiveExamSession(
+                    user_id=instance.student_id,
+                    exam_id=instance.exam_id,
+                    device_session_id=instance.device_session_id,
+                    attempt=instance,
+                    session_token=session_token,
+                    is_active=True,
+                )
+            ],
+            update_conflicts=True,
+            unique_fields=['user', 'exam'],
+            update_fields=['device_session', 'attempt', 'session_token', 'is_active'],
         )
+        ActiveExamSession.record_activity(session_token)
     elif instance.status in [ExamAttempt.Status.SUBMITTED, ExamAttempt.Status.TERMINATED]:
         # Deactivate session on completion or termination
         ActiveExamSession.objects.filter(
-            user=instance.student,
-            exam=instance.exam
-        ).update(is_active=False)
\ No newline at end of file
+            user_id=instance.student_id,
+            exam_id=instance.exam_id,
+            is_active=True
+        ).update(is_active=False)
+
+
+def _adjust_exam_total_points(exam_id, delta):
+    """Apply a point delta to an exam's stored total in a single UPDATE."""
+    if delta:
+        Exam.objects.filter(pk=exam_id).update(total_points=F('total_points') + delta)
+
+
+def _adjust_bank_question_count(bank_id, delta):
+    """Apply a delta to a question bank's stored active question count in a single UPDATE."""
+    if delta:
+        QuestionBank.objects.filter(pk=bank_id).update(
+            active_question_count=F('active_question_count') + delta
+        )
+
+
+def invalidate_institution_exams(sender, **kwargs):
+    """Expire the cached institution exam sets when the exam-to-institution path changes."""
+    if kwargs.get('action', 'post_').startswith('pre_'):
+        return
+    try:
+        cache.incr(Exam.INSTITUTION_VERSION_KEY)
+    except ValueError:
+        cache.set(Exam.INSTITUTION_VERSION_KEY, 1, None)
+
+
+m2m_changed.connect(invalidate_institution_exams, sender=Exam.sections.through)
+for institution_path_model in (Section, Course, AcademicDepartment):
+    post_save.connect(invalidate_institution_exams, sender=institution_path_model)
+    post_delete.connect(invalidate_institution_exams, sender=institution_path_model)
+
+
+# Attempt fields the cached exam timer is derived from
+TIMER_SOURCE_FIELDS = frozenset({'status', 'start_time'})
+
+
+@receiver(post_save, sender=ExamAttempt)
+def invalidate_attempt_timer(sender, instance, created, update_fields=None, **kwargs):
+    """Drop the cached timer state when an attempt starts, ends or restarts."""
+    if created or (update_fields is not None and not TIMER_SOURCE_FIELDS.intersection(update_fields)):
+        return
+    cache.delete(ExamAttempt.timer_cache_key(instance.pk))
+
+
+@receiver(post_save, sender=Exam)
+def invalidate_exam_timers(sender, instance, created, update_fields=None, **kwargs):
+    """Drop cached timers of running attempts when the exam's duration may have changed."""
+    if created or (update_fields is not None and 'duration' not in update_fields):
+        return
+    attempt_ids = instance.attempts.filter(
+        status=ExamAttempt.Status.IN_PROGRESS
+    ).values_list('pk', flat=True)
+    cache.delete_many([ExamAttempt.timer_cache_key(pk) for pk in attempt_ids])
+
+
+@receiver(post_save, sender=ExamQuestion)
+@receiver(post_delete, sender=ExamQuestion)
+def invalidate_exam_question_order(sender, instance, **kwargs):
+    """Drop the cached question order of the exam a question was added to, moved from or removed from."""
+    exam_ids = {instance.exam_id, getattr(instance, '_loaded_exam_id', None)} - {None}
+    cache.delete_many([Exam.question_order_cache_key(exam_id) for exam_id in exam_ids])
+
+
+@receiver(post_save, sender=ExamQuestion)
+def update_exam_total_points(sender, instance, created, **kwargs):
+    """
+    Keep Exam.total_points in step with exam question point values.
+    Applies the change as an incremental UPDATE rather than re-aggregating.
+    """
+    points = Decimal(str(instance.points))
+    old_exam_id = getattr(instance, '_loaded_exam_id', None)
+    old_points = getattr(instance, '_loaded_points', None)
+    
+    if created:
+        _adjust_exam_total_points(instance.exam_id, points)
+    elif old_exam_id is None or old_points is None:
+        # Previous values are unknown, fall back to a full recalculation
+        instance.exam.recalculate_total_points()
+    elif old_exam_id != instance.exam_id:
+        _adjust_exam_total_points(old_exam_id, -old_points)
+        _adjust_exam_total_points(instance.exam_id, points)
+    else:
+        _adjust_exam_total_points(instance.exam_id, points - old_points)
+    
+    instance._loaded_exam_id = instance.exam_id
+    instance._loaded_points = points
+
+
+@receiver(post_delete, sender=ExamQuestion)
+def release_exam_total_points(sender, instance, **kwargs):
+    """Remove a deleted exam question's points from the exam total."""
+    points = getattr(instance, '_loaded_points', None)
+    if points is None:
+        points = Decimal(str(instance.points))
+    _adjust_exam_total_points(getattr(instance, '_loaded_exam_id', None) or instance.exam_id, -points)
+
+
+@receiver(post_save, sender=Question)
+def update_bank_question_count(sender, instance, created, **kwargs):
+    """Keep QuestionBank.active_question_count in step as questions are added, moved or toggled."""
+    old_bank_id = None if created else getattr(instance, '_loaded_bank_id', None)
+    old_active = False if created else getattr(instance, '_loaded_is_active', None)
+    
+    if old_active is None or (old_active and old_bank_id is None):
+        # Previous values are unknown, fall back to a full recount
+        instance.bank.recalculate_active_question_count()
+    else:
+        if old_active:
+            _adjust_bank_question_count(old_bank_id, -1)
+        if instance.is_active:
+            _adjust_bank_question_count(instance.bank_id, 1)
+    
+    instance._loaded_bank_id = instance.bank_id
+    instance._loaded_is_active = instance.is_active
+
+
+@receiver(post_delete, sender=Question)
+def release_bank_question_count(sender, instance, **kwargs):
+    """Remove a deleted active question from its bank's stored count."""
+    is_active = getattr(instance, '_loaded_is_active', None)
+    if is_active is None:
+        is_active = instance.is_active
+    if is_active:
+        _adjust_bank_question_count(getattr(instance, '_loaded_bank_id', None) or instance.bank_id, -1)
+
+
+@receiver(post_save, sender=MonitoringEvent)
+def update_attempt_pending_events(sender, instance, created, **kwargs):
+    """
+    Keep the attempt's pending event summary in step with event saves.
+    New pending events are applied incrementally; review transitions and
+    severity changes on pending events trigger a recompute.
+    """
+    is_pending = instance.reviewed_status == MonitoringEvent.ReviewedStatus.PENDING
+    if created:
+        if is_pending:
+            ExamAttempt.add_pending_events(instance.attempt_id, 1, instance.severity)
+        return
+
+    was_pending = getattr(instance, '_loaded_pending', None)
+    if (
+        was_pending is None
+        or was_pending != is_pending
+        or (is_pending and instance.severity != getattr(instance, '_loaded_severity', None))
+    ):
+        ExamAttempt.refresh_pending_events([instance.attempt_id])
+    instance._loaded_pending = is_pending
+    instance._loaded_severity = instance.severity
+
+
+@receiver(post_delete, sender=MonitoringEvent)
+def release_attempt_pending_events(sender, instance, **kwargs):
+    """Drop a deleted pending event from its attempt's summary."""
+    if instance.reviewed_status == MonitoringEvent.ReviewedStatus.PENDING:
+        ExamAttempt.refresh_pending_events([instance.attempt_id])
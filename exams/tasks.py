@@ -0,0 +1,158 @@
+import atexit
+import collections
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import ActiveExamSession, BulkQuestionImport, MonitoringEvent
+
+logger = logging.getLogger(__name__)
+
+# Per-process queue of proctoring events awaiting a batched insert
+monitoring_buffer = collections.deque()
+_monitoring_flusher = None
+_monitoring_flusher_lock = threading.Lock()
+
+# Bounded pool so a burst of uploads queues imports instead of running them all at once
+_import_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'QUESTION_IMPORT_WORKERS', 2),
+    thread_name_prefix='question-import'
+)
+
+
+def run_bulk_import(import_id):
+    """
+    Process a pending bulk question import outside the request cycle.
+    
+    Args:
+        import_id (int): Primary key of the BulkQuestionImport to process
+    """
+    try:
+        bulk_import = BulkQuestionImport.objects.select_related(
+            'question_bank', 'uploaded_by'
+        ).get(pk=import_id)
+        bulk_import.process_import()
+    finally:
+        # Worker threads own their database connection
+        connection.close()
+
+
+def enqueue_bulk_import(bulk_import):
+    """
+    Schedule a bulk question import to run once the current transaction commits.
+    
+    The import runs on a worker from a pool of QUESTION_IMPORT_WORKERS
+    threads so the upload request returns immediately; progress is reported
+    through the import's status and counter fields.
+    
+    Args:
+        bulk_import (BulkQuestionImport): Saved import record to process
+    """
+    import_id = bulk_import.pk
+    transaction.on_commit(lambda: _import_executor.submit(run_bulk_import, import_id))
+
+
+def flush_session_activity():
+    """
+    Persist cached active-session heartbeats to the database.
+    
+    Intended to run every 30-60 seconds from a scheduler (see the
+    flush_session_activity management command).
+    
+    Returns:
+        int: Number of sessions updated
+    """
+    return ActiveExamSession.flush_cached_activity()
+
+
+def buffer_monitoring_events(events):
+    """
+    Queue proctoring events to be written by the next periodic flush.
+    
+    Events are persisted in one batch per interval (see
+    MONITORING_EVENT_FLUSH_INTERVAL) instead of one INSERT per webhook call;
+    large batches use COPY on PostgreSQL through MonitoringEvent.bulk_ingest.
+    
+    Args:
+        events (list): Unsaved MonitoringEvent instances
+    """
+    monitoring_buffer.extend(events)
+    _start_monitoring_flusher()
+
+
+def flush_monitoring_events():
+    """
+    Persist every buffered proctoring event in a single batch.
+    
+    If the batch fails, events are retried one at a time so a single bad
+    event cannot discard the rest. Events that still fail are put back for
+    the next flush, up to MONITORING_EVENT_MAX_RETRIES times, then logged
+    and dropped.
+    
+    Returns:
+        int: Number of events written
+    """
+    events = []
+    while True:
+        try:
+            events.append(monitoring_buffer.popleft())
+        except IndexError:
+            break
+    if not events:
+        return 0
+    
+    try:
+        MonitoringEvent.bulk_ingest(events)
+        return len(events)
+    except Exception:
+        logger.exception("Batch insert of %d monitoring events failed, retrying individually", len(events))
+    
+    max_retries = getattr(settings, 'MONITORING_EVENT_MAX_RETRIES', 3)
+    written = 0
+    for event in events:
+        try:
+            MonitoringEvent.bulk_ingest([event])
+            written += 1
+        except Exception:
+            event._flush_failures = getattr(event, '_flush_failures', 0) + 1
+            if event._flush_failures < max_retries:
+                monitoring_buffer.append(event)
+            else:
+                logger.exception(
+                    "Dropping monitoring event for attempt %s after %d failed writes",
+                    event.attempt_id, event._flush_failures
+                )
+    return written
+
+
+def _run_monitoring_flusher():
+    interval = getattr(settings, 'MONITORING_EVENT_FLUSH_INTERVAL', 1.0)
+    while True:
+        time.sleep(interval)
+        try:
+            flush_monitoring_events()
+        except Exception:
+            logger.exception("Failed to flush buffered monitoring events")
+        finally:
+            # Worker threads own their database connection
+            connection.close()
+
+
+def _start_monitoring_flusher():
+    global _monitoring_flusher
+    if _monitoring_flusher is not None:
+        return
+    with _monitoring_flusher_lock:
+        if _monitoring_flusher is None:
+            _monitoring_flusher = threading.Thread(
+                target=_run_monitoring_flusher,
+                name='monitoring-event-flusher',
+                daemon=True
+            )
+            _monitoring_flusher.start()
+            # The flusher is a daemon thread, so drain the buffer on shutdown
+            atexit.register(flush_monitoring_events)
@@ -1,3 +1,352 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+import pandas as pd
+
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import AcademicDepartment, Course, Enrollment, Institution, Section, User
+from .forms import ExamForm
+from .models import (
+    BulkQuestionImport, Exam, ExamAttempt, ExamQuestion, MonitoringEvent, Question, QuestionBank,
+    QuestionResponse
+)
+
+
+class ExamFixtureMixin:
+    """Institution with one instructor, one enrolled student, a question bank and a live exam."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.institution = Institution.objects.create(name='Test University', domain='test.edu')
+        cls.instructor = User.objects.create_user(
+            username='instructor@test.edu', email='instructor@test.edu', password='pw',
+            role=User.Role.INSTRUCTOR, institution=cls.institution
+        )
+        cls.student = User.objects.create_user(
+            username='student@test.edu', email='student@test.edu', password='pw',
+            role=User.Role.STUDENT, institution=cls.institution
+        )
+        department = AcademicDepartment.objects.create(
+            institution=cls.institution, code='CS', name='Computer Science'
+        )
+        course = Course.objects.create(department=department, code='CS101', name='Intro', credits=3)
+        cls.section = Section.objects.create(
+            course=course, section_code='A', term='F', year=2026, instructor=cls.instructor
+        )
+        Enrollment.objects.create(student=cls.student, section=cls.section)
+        cls.bank = QuestionBank.objects.create(
+            name='Bank', institution=cls.institution, created_by=cls.instructor
+        )
+        now = timezone.now()
+        cls.exam = Exam.objects.create(
+            title='Midterm', instructions='Answer everything', duration=30,
+            start_date=now - timedelta(hours=1), end_date=now + timedelta(hours=2),
+            created_by=cls.instructor, status=Exam.Status.LIVE
+        )
+        cls.exam.sections.add(cls.section)
+
+    def create_question(self, bank=None, **kwargs):
+        kwargs.setdefault('question_text', 'What is 2 + 2?')
+        kwargs.setdefault('type', Question.Type.MULTIPLE_CHOICE)
+        return Question.objects.create(bank=bank or self.bank, created_by=self.instructor, **kwargs)
+
+
+class ExamDetailViewTests(ExamFixtureMixin, TestCase):
+
+    def test_educator_stats_with_ungraded_submitted_attempt(self):
+        question = self.create_question()
+        ExamQuestion.objects.create(exam=self.exam, question=question, order=0, points=2)
+        attempt = ExamAttempt.objects.create(
+            exam=self.exam, student=self.student, status=ExamAttempt.Status.SUBMITTED,
+            start_time=timezone.now() - timedelta(minutes=10), end_time=timezone.now()
+        )
+        QuestionResponse.objects.create(attempt=attempt, question=question, student_answer={'answer': 'A'})
+
+        self.client.force_login(self.instructor)
+        response = self.client.get(reverse('exams:exam_detail', kwargs={'pk': self.exam.pk}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['completed_count'], 1)
+        self.assertEqual(response.context['avg_score'], 0)
+
+
+class BulkQuestionUploadTests(ExamFixtureMixin, TestCase):
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media_override = override_settings(MEDIA_ROOT=media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.client.force_login(self.instructor)
+
+    def upload(self):
+        csv_file = SimpleUploadedFile(
+            'questions.csv',
+            b'question_text,type,points,estimated_time,learning_objective,is_active\n'
+            b'What is 2 + 2?,MC,1,60,,True\n',
+            content_type='text/csv'
+        )
+        return self.client.post(
+            reverse('exams:bulk_question_upload', kwargs={'question_bank_id': self.bank.pk}),
+            {'import_file': csv_file}
+        )
+
+    def test_upload_creates_and_enqueues_import(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.upload()
+
+        bulk_import = BulkQuestionImport.objects.get()
+        self.assertEqual(bulk_import.question_bank, self.bank)
+        self.assertEqual(bulk_import.uploaded_by, self.instructor)
+        self.assertEqual(bulk_import.status, BulkQuestionImport.Status.PENDING)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_upload_redirects_to_progress_and_status_endpoint(self):
+        with self.captureOnCommitCallbacks():
+            response = self.upload()
+        bulk_import = BulkQuestionImport.objects.get()
+        upload_url = reverse('exams:bulk_question_upload', kwargs={'question_bank_id': self.bank.pk})
+        self.assertRedirects(
+            response, f'{upload_url}?import={bulk_import.pk}', fetch_redirect_response=False
+        )
+
+        page = self.client.get(response.url)
+        self.assertEqual(page.status_code, 200)
+        self.assertEqual(page.context['bulk_import'], bulk_import)
+
+        status_url = reverse('exams:api_bulk_import_status', kwargs={'import_id': bulk_import.pk})
+        status = self.client.get(status_url).json()
+        self.assertEqual(status['status'], BulkQuestionImport.Status.PENDING)
+        self.assertFalse(status['finished'])
+
+        bulk_import.process_import()
+        status = self.client.get(status_url).json()
+        self.assertEqual(status['status'], BulkQuestionImport.Status.COMPLETED)
+        self.assertEqual(status['successful_imports'], 1)
+        self.assertTrue(status['finished'])
+
+    def test_download_import_template(self):
+        response = self.client.get(
+            reverse('exams:download_template', kwargs={'question_bank_id': self.bank.pk})
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment', response['Content-Disposition'])
+        self.assertTrue(b''.join(response.streaming_content).startswith(b'PK'))
+
+
+class QuestionPointsValidationTests(ExamFixtureMixin, TestCase):
+
+    def test_import_rejects_points_below_minimum(self):
+        df = pd.DataFrame({
+            'question_text': ['Q1', 'Q2', 'Q3'],
+            'type': ['MC', 'MC', 'MC'],
+            'points': ['0.001', '0.01', '2'],
+        })
+        rows, errors = BulkQuestionImport()._prepare_import_rows(df)
+
+        self.assertEqual(errors[0], "Points must be at least 0.01")
+        self.assertTrue(pd.isna(errors[1]))
+        self.assertTrue(pd.isna(errors[2]))
+        self.assertEqual(rows['points'][1], Decimal('0.01'))
+
+    def test_exam_question_clean_rejects_points_below_minimum(self):
+        question = self.create_question()
+        exam_question = ExamQuestion(exam=self.exam, question=question, points=Decimal('0.001'))
+        with self.assertRaises(ValidationError):
+            exam_question.clean()
+        exam_question.points = Decimal('0.01')
+        exam_question.clean()
+
+
+class ExamPasswordMigrationTests(TransactionTestCase):
+    migrate_from = ('exams', '0011_examattempt_cover_idx')
+    migrate_to = ('exams', '0012_exam_password_hash')
+
+    def tearDown(self):
+        # Leave the schema fully migrated for the tests that follow
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate([target])
+        return executor.loader.project_state([target]).apps
+
+    def test_plaintext_passwords_are_hashed(self):
+        apps = self.migrate(self.migrate_from)
+        User = apps.get_model('core', 'User')
+        OldExam = apps.get_model('exams', 'Exam')
+        creator = User.objects.create(username='instructor@test.edu', email='instructor@test.edu')
+        now = timezone.now()
+        exams = {
+            password: OldExam.objects.create(
+                title=f'Exam {index}', instructions='Answer everything', duration=30,
+                start_date=now, end_date=now + timedelta(hours=1),
+                created_by=creator, exam_password=password
+            ).pk
+            for index, password in enumerate(['secret', '', '   '])
+        }
+
+        apps = self.migrate(self.migrate_to)
+        NewExam = apps.get_model('exams', 'Exam')
+
+        hashed = NewExam.objects.get(pk=exams['secret']).exam_password_hash
+        self.assertEqual(bytes(hashed), Exam.hash_exam_password('secret'))
+        self.assertEqual(bytes(NewExam.objects.get(pk=exams['']).exam_password_hash), b'')
+        self.assertEqual(bytes(NewExam.objects.get(pk=exams['   ']).exam_password_hash), b'')
+
+
+class ExamFormPasswordTests(ExamFixtureMixin, TestCase):
+
+    def submit(self, **data):
+        form_data = {
+            'title': self.exam.title,
+            'instructions': self.exam.instructions,
+            'duration': self.exam.duration,
+            'max_attempts': self.exam.max_attempts,
+            'pass_percentage': self.exam.pass_percentage,
+            'start_date': self.exam.start_date.strftime('%Y-%m-%dT%H:%M'),
+            'end_date': self.exam.end_date.strftime('%Y-%m-%dT%H:%M'),
+            'time_zone': self.exam.time_zone,
+        }
+        form_data.update(data)
+        form = ExamForm(form_data, instance=self.exam)
+        self.assertTrue(form.is_valid(), form.errors)
+        exam = form.save()
+        exam.refresh_from_db()
+        return exam
+
+    def test_set_keep_and_clear_password(self):
+        exam = self.submit(exam_password='  secret  ')
+        self.assertTrue(exam.requires_password)
+        self.assertTrue(exam.validate_password('secret'))
+        self.assertFalse(exam.validate_password('wrong'))
+
+        exam = self.submit(exam_password='')
+        self.assertTrue(exam.validate_password('secret'))
+
+        exam = self.submit(exam_password='   ')
+        self.assertTrue(exam.validate_password('secret'))
+
+        exam = self.submit(clear_exam_password='on')
+        self.assertFalse(exam.requires_password)
+        self.assertTrue(exam.validate_password(''))
+
+
+class CounterReceiverTests(ExamFixtureMixin, TestCase):
+
+    def assertTotalPoints(self, exam, expected):
+        exam.refresh_from_db()
+        self.assertEqual(exam.total_points, Decimal(expected))
+
+    def assertActiveCount(self, bank, expected):
+        bank.refresh_from_db()
+        self.assertEqual(bank.active_question_count, expected)
+
+    def create_exam(self):
+        return Exam.objects.create(
+            title='Final', instructions='Answer everything', duration=30,
+            start_date=self.exam.start_date, end_date=self.exam.end_date,
+            created_by=self.instructor
+        )
+
+    def test_exam_total_points(self):
+        first, second = self.create_question(), self.create_question()
+        other_exam = self.create_exam()
+
+        exam_question = ExamQuestion.objects.create(exam=self.exam, question=first, points=2)
+        ExamQuestion.objects.create(exam=self.exam, question=second, points=3)
+        self.assertTotalPoints(self.exam, '5')
+
+        exam_question = ExamQuestion.objects.get(pk=exam_question.pk)
+        exam_question.points = Decimal('4.5')
+        exam_question.save()
+        self.assertTotalPoints(self.exam, '7.5')
+
+        exam_question.exam = other_exam
+        exam_question.save()
+        self.assertTotalPoints(self.exam, '3')
+        self.assertTotalPoints(other_exam, '4.5')
+
+        exam_question.delete()
+        self.assertTotalPoints(other_exam, '0')
+
+        # Deleting the question cascades to its exam questions
+        second.delete()
+        self.assertTotalPoints(self.exam, '0')
+
+    def test_bank_active_question_count(self):
+        other_bank = QuestionBank.objects.create(
+            name='Other', institution=self.institution, created_by=self.instructor
+        )
+        question = self.create_question()
+        self.create_question(is_active=False)
+        self.assertActiveCount(self.bank, 1)
+
+        question = Question.objects.get(pk=question.pk)
+        question.is_active = False
+        question.save()
+        self.assertActiveCount(self.bank, 0)
+
+        question.is_active = True
+        question.save()
+        self.assertActiveCount(self.bank, 1)
+
+        question.bank = other_bank
+        question.save()
+        self.assertActiveCount(self.bank, 0)
+        self.assertActiveCount(other_bank, 1)
+
+        question.delete()
+        self.assertActiveCount(other_bank, 0)
+
+        # Queryset deletes still release each active question
+        self.create_question(bank=other_bank)
+        self.create_question(bank=other_bank)
+        self.assertActiveCount(other_bank, 2)
+        Question.objects.filter(bank=other_bank).delete()
+        self.assertActiveCount(other_bank, 0)
+
+    def test_attempt_pending_events(self):
+        attempt = ExamAttempt.objects.create(exam=self.exam, student=self.student)
+
+        def create_event(severity):
+            return MonitoringEvent.objects.create(
+                attempt=attempt, event_type=MonitoringEvent.EventType.TAB_SWITCH, severity=severity
+            )
+
+        low, high = create_event(3), create_event(8)
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.pending_events_count, attempt.max_pending_severity), (2, 8))
+
+        high = MonitoringEvent.objects.get(pk=high.pk)
+        high.reviewed_status = MonitoringEvent.ReviewedStatus.FALSE_ALARM
+        high.save()
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.pending_events_count, attempt.max_pending_severity), (1, 3))
+
+        high.reviewed_status = MonitoringEvent.ReviewedStatus.PENDING
+        high.save()
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.pending_events_count, attempt.max_pending_severity), (2, 8))
+
+        high.delete()
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.pending_events_count, attempt.max_pending_severity), (1, 3))
+
+        low.delete()
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.pending_events_count, attempt.max_pending_severity), (0, 0))
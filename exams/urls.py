@@ -22,6 +22,7 @@ urlpatterns = [
     path('question-banks/<int:pk>/update/', views.QuestionBankUpdateView.as_view(), name='question_bank_update'),
     path('question-banks/<int:pk>/delete/', views.QuestionBankDeleteView.as_view(), name='question_bank_delete'),
     path('question-banks/<int:question_bank_id>/bulk-upload/', views.bulk_question_upload, name='bulk_question_upload'),
+    path('question-banks/<int:question_bank_id>/import-template/', views.download_import_template, name='download_template'),
     
     # Question URLs
     path('questions/create/', views.QuestionCreateView.as_view(), name='question_create'),
@@ -48,6 +49,8 @@ urlpatterns = [
     # API URLs
     path('api/exams/<int:exam_id>/questions/', views.api_exam_questions, name='api_exam_questions'),
     path('api/attempts/<int:attempt_id>/questions/<int:question_id>/save/', views.api_save_response, name='api_save_response'),
+    path('api/attempts/<int:attempt_id>/time-remaining/', views.api_time_remaining, name='api_time_remaining'),
+    path('api/imports/<int:import_id>/status/', views.api_bulk_import_status, name='api_bulk_import_status'),
 ]
 
 # Error handlers (if you want to keep them specific to the exams app)
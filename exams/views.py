@@ -1,46 +1,72 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView, TemplateView
 from django.urls import reverse_lazy, reverse
 from django.utils.decorators import method_decorator
-from django.core.exceptions import PermissionDenied
-from django.db.models import Q, Count, Sum, Avg, F, ExpressionWrapper, DurationField, Max, Min
+from django.utils.functional import cached_property
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, PermissionDenied, ValidationError
+from django.core.paginator import Paginator
+from django.db.models import (
+    Q, Count, Sum, Avg, F, DecimalField, ExpressionWrapper, DurationField, Max, Min, Value
+)
+from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods, require_POST
 from django.forms import modelformset_factory
 import json
 import csv
+import hashlib
 from datetime import timedelta
+from decimal import Decimal
 
-from core.models import User, Institution, AcademicDepartment, Course, Section, Enrollment, UserDeviceSession
+from core.models import User, Institution, AcademicDepartment, Course, Section, UserDeviceSession
 from .models import (
     Exam, Question, QuestionBank, ExamAttempt, ExamQuestion, 
-    QuestionResponse, MonitoringEvent, BulkQuestionImport, ActiveExamSession
+    QuestionResponse, MonitoringEvent, BulkQuestionImport, ActiveExamSession,
+    validate_evidence_size
 )
 
 from .forms import (
     ExamForm, QuestionForm, QuestionBankForm, BulkQuestionUploadForm
 )
+from .tasks import buffer_monitoring_events, enqueue_bulk_import
+
+# Attempt statuses that count as finished for exam statistics
+COMPLETED_STATUSES = (ExamAttempt.Status.SUBMITTED, ExamAttempt.Status.AUTO_SUBMITTED)
 
 # Utility functions
+def has_role(user, *roles):
+    return user.is_authenticated and user.role in roles
+
 def is_superadmin(user):
-    return user.is_authenticated and user.role == User.Role.SUPERADMIN
+    return has_role(user, User.Role.SUPERADMIN)
 
 def is_admin(user):
-    return user.is_authenticated and user.role == User.Role.ADMIN
+    return has_role(user, User.Role.ADMIN)
 
 def is_instructor(user):
-    return user.is_authenticated and user.role == User.Role.INSTRUCTOR
+    return has_role(user, User.Role.INSTRUCTOR)
 
 def is_student(user):
-    return user.is_authenticated and user.role == User.Role.STUDENT
+    return has_role(user, User.Role.STUDENT)
+
+def can_manage_exam(user, exam):
+    """Check whether an educator may view or manage an exam and its attempts."""
+    return (
+        user.is_superadmin
+        or exam.created_by_id == user.pk
+        or exam.pk in Exam.ids_for_institution(user.institution_id)
+    )
 
 def instructor_required(view_func):
     decorated_view_func = login_required(user_passes_test(
-        lambda u: is_instructor(u) or is_admin(u) or is_superadmin(u),
+        lambda u: has_role(u, User.Role.INSTRUCTOR, User.Role.ADMIN, User.Role.SUPERADMIN),
         login_url='login',
         redirect_field_name=None
     )(view_func))
@@ -54,32 +80,102 @@ def student_required(view_func):
     )(view_func))
     return decorated_view_func
 
+class FastCountPaginator(Paginator):
+    """
+    Paginator for list querysets filtered through related tables.
+    
+    The total is counted over primary keys only and cached briefly, and each
+    page is resolved by slicing primary keys first, so only the rows on the
+    page are fully loaded.
+    """
+    
+    COUNT_CACHE_TIMEOUT = 30
+    
+    @cached_property
+    def count(self):
+        pks = self.object_list.values('pk').order_by()
+        try:
+            sql = str(pks.query)
+        except EmptyResultSet:
+            return 0
+        cache_key = 'paginator:count:' + hashlib.md5(sql.encode()).hexdigest()
+        return cache.get_or_set(cache_key, pks.count, self.COUNT_CACHE_TIMEOUT)
+    
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        page_pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        return self._get_page(list(self.object_list.filter(pk__in=page_pks)), number, self)
+
+class ConditionalGetMixin:
+    """
+    Answer repeat GETs with 304 Not Modified while the page is unchanged.
+    
+    Views return a fingerprint of the data the page renders from
+    get_etag_source(), or None to always render. Requests with pending
+    flash messages are always rendered so the messages are shown. It is combined with the
+    query string and the user fields shown in the page header, so a
+    client's cached copy is only reused for the same page and account.
+    """
+    
+    def get_etag_source(self):
+        return None
+    
+    def get_etag(self):
+        source = self.get_etag_source()
+        if source is None:
+            return None
+        user = self.request.user
+        identity = (
+            user.pk, user.role, user.first_name, user.last_name,
+            user.institution_id, self.request.session.session_key
+        )
+        fingerprint = repr((identity, self.request.GET.urlencode(), source))
+        return quote_etag(hashlib.md5(fingerprint.encode()).hexdigest())
+    
+    def get(self, request, *args, **kwargs):
+        # A 304 would hide pending flash messages, so render whenever any are
+        # queued; len() checks the storage without marking it as read
+        etag = None if len(messages.get_messages(request)) else self.get_etag()
+        if etag is None:
+            return super().get(request, *args, **kwargs)
+        
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response.headers.setdefault('ETag', etag)
+        # Per-user page that the browser must revalidate before reuse
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
 # Exam Views
 @method_decorator(login_required, name='dispatch')
-class ExamListView(ListView):
+class ExamListView(ConditionalGetMixin, ListView):
     model = Exam
     template_name = 'exams/exam_list.html'
     context_object_name = 'exams'
     paginate_by = 20
+    paginator_class = FastCountPaginator
     
     def get_queryset(self):
+        # One timestamp so every date filter in this request agrees
+        now = timezone.now()
+        
         if self.request.user.is_superadmin:
-            queryset = Exam.objects.select_related('created_by')
+            queryset = Exam.objects.all()
         elif self.request.user.is_admin or self.request.user.is_instructor:
             # Get exams where user is creator or where sections belong to user's institution
-            queryset = Exam.objects.filter(
-                Q(created_by=self.request.user) | 
-                Q(sections__course__department__institution=self.request.user.institution)
-            ).distinct().select_related('created_by')
+            queryset = Exam.objects.managed_by(self.request.user)
         else:  # Student
             # Get exams for sections where student is enrolled
-            queryset = Exam.objects.filter(
-                sections__enrollments__student=self.request.user,
-                sections__enrollments__is_active=True,
+            queryset = Exam.objects.enrolled(self.request.user).filter(
                 status=Exam.Status.LIVE,
-                start_date__lte=timezone.now(),
-                end_date__gte=timezone.now()
-            ).select_related('created_by').distinct()
+                start_date__lte=now,
+                end_date__gte=now
+            )
         
         # Filtering
         status = self.request.GET.get('status')
@@ -88,20 +184,29 @@ class ExamListView(ListView):
             if status == 'active':
                 queryset = queryset.filter(
                     status=Exam.Status.LIVE,
-                    start_date__lte=timezone.now(),
-                    end_date__gte=timezone.now()
+                    start_date__lte=now,
+                    end_date__gte=now
                 )
             elif status == 'upcoming':
                 queryset = queryset.filter(
                     status=Exam.Status.LIVE,
-                    start_date__gt=timezone.now()
+                    start_date__gt=now
                 )
             elif status == 'completed':
-                queryset = queryset.filter(end_date__lt=timezone.now())
+                queryset = queryset.filter(end_date__lt=now)
             elif status == 'draft':
                 queryset = queryset.filter(status=Exam.Status.DRAFT)
         
-        return queryset
+        # Load only what the list cards show
+        return queryset.only('title', 'status', 'start_date', 'end_date', 'duration')
+    
+    def get_etag_source(self):
+        # Students poll this list for newly opened exams. Their list is limited to
+        # exams live right now, so fingerprint that small set. Educator pages
+        # also show course filters and are always rendered.
+        if not self.request.user.is_student:
+            return None
+        return list(self.get_queryset().values_list('pk', 'updated_at'))
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -137,22 +242,30 @@ class ExamCreateView(CreateView):
         return super().form_valid(form)
 
 @method_decorator(login_required, name='dispatch')
-class ExamDetailView(DetailView):
+class ExamDetailView(ConditionalGetMixin, DetailView):
     model = Exam
     template_name = 'exams/exam_detail.html'
     context_object_name = 'exam'
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.user.is_student:
+            queryset = queryset.with_student_access(self.request.user)
+        return queryset
+    
+    def get_object(self, queryset=None):
+        # dispatch() and get() both need the exam, so fetch it once per request
+        if not hasattr(self, '_exam'):
+            self._exam = super().get_object(queryset)
+        return self._exam
+    
     def dispatch(self, request, *args, **kwargs):
         exam = self.get_object()
         
         # Check permissions
         if request.user.is_student:
             # Check if student is enrolled in any section that has this exam
-            if not Enrollment.objects.filter(
-                student=request.user,
-                section__in=exam.sections.all(),
-                is_active=True
-            ).exists():
+            if not exam.has_access:
                 raise PermissionDenied("You don't have permission to view this exam.")
             
             # Check if exam is active
@@ -161,37 +274,65 @@ class ExamDetailView(DetailView):
         
         elif request.user.is_educator and not request.user.is_superadmin:
             # Check if educator belongs to the same institution
-            if not exam.sections.filter(
-                course__department__institution=request.user.institution
-            ).exists() and exam.created_by != request.user:
+            if not can_manage_exam(request.user, exam):
                 raise PermissionDenied("You don't have permission to view this exam.")
         
         return super().dispatch(request, *args, **kwargs)
     
+    def get_etag_source(self):
+        # Educator statistics move with every attempt, so only the student page
+        # is fingerprinted: the exam row and the student's own attempts
+        if not self.request.user.is_student:
+            return None
+        exam = self.get_object()
+        attempts = exam.attempts.filter(student=self.request.user).annotate(
+            last_response=Max('responses__updated_at')
+        ).values_list('pk', 'status', 'start_time', 'end_time', 'last_response')
+        return (exam.updated_at, exam.total_points, list(attempts))
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
         if self.request.user.is_educator:
             # Add statistics for instructors
-            attempts = ExamAttempt.objects.filter(exam=self.object)
-            context['attempt_count'] = attempts.count()
-            context['completed_count'] = attempts.filter(status=ExamAttempt.Status.SUBMITTED).count()
-            context['in_progress_count'] = attempts.filter(status=ExamAttempt.Status.IN_PROGRESS).count()
+            # Attempts are joined to their responses to total the points awarded,
+            # so attempt counts must be distinct
+            completed = Q(status__in=COMPLETED_STATUSES)
+            stats = self.object.attempts.aggregate(
+                attempt_count=Count('id', distinct=True),
+                completed_count=Count('id', distinct=True, filter=completed),
+                in_progress_count=Count('id', distinct=True, filter=Q(status=ExamAttempt.Status.IN_PROGRESS)),
+                # Ungraded responses have no points, so the sum may be NULL
+                points_awarded=Coalesce(
+                    Sum('responses__points_awarded', filter=completed),
+                    Value(Decimal('0')),
+                    output_field=DecimalField(max_digits=8, decimal_places=2)
+                )
+            )
+            context['attempt_count'] = stats['attempt_count']
+            context['completed_count'] = stats['completed_count']
+            context['in_progress_count'] = stats['in_progress_count']
             
-            if context['completed_count'] > 0:
-                context['avg_score'] = attempts.filter(status=ExamAttempt.Status.SUBMITTED).aggregate(
-                    avg_score=Avg('score')
-                )['avg_score']
+            if stats['completed_count'] > 0 and self.object.total_points:
+                # Average score as a percentage of the exam's total points
+                context['avg_score'] = (
+                    stats['points_awarded'] / stats['completed_count']
+                    / self.object.total_points * 100
+                )
             
-            # Add question statistics
-            context['question_stats'] = []
-            for exam_question in self.object.exam_questions.select_related('question').all():
-                responses = QuestionResponse.objects.filter(
-                    question=exam_question.question, 
+            # Add question statistics, counting responses per question in one grouped query
+            response_counts = dict(
+                QuestionResponse.objects.filter(
                     attempt__exam=self.object,
-                    attempt__status=ExamAttempt.Status.SUBMITTED
-                )
-                total_count = responses.count()
+                    attempt__status__in=COMPLETED_STATUSES
+                ).order_by().values_list('question_id').annotate(total=Count('id'))
+            )
+            context['question_stats'] = []
+            exam_questions = self.object.exam_questions.select_related('question').only(
+                'order', 'question__question_text', 'question__type', 'question__points'
+            )
+            for exam_question in exam_questions:
+                total_count = response_counts.get(exam_question.question_id, 0)
                 
                 if total_count > 0:
                     # For multiple choice questions, check correctness
@@ -203,6 +344,7 @@ class ExamDetailView(DetailView):
                     
                     accuracy = (correct_count / total_count) * 100 if total_count > 0 else 0
                 else:
+                    correct_count = 0
                     accuracy = 0
                 
                 context['question_stats'].append({
@@ -212,6 +354,12 @@ class ExamDetailView(DetailView):
                     'accuracy': accuracy
                 })
         
+        elif self.request.user.is_student:
+            # Evaluated once by the template's emptiness check and reused by its loop
+            context['student_attempts'] = list(
+                self.object.attempts.filter(student=self.request.user).with_scores()
+            )
+        
         return context
 
 @method_decorator(instructor_required, name='dispatch')
@@ -227,7 +375,7 @@ class ExamUpdateView(UpdateView):
         exam = self.get_object()
         
         # Check permissions
-        if not request.user.is_superadmin and exam.created_by != request.user:
+        if not request.user.is_superadmin and exam.created_by_id != request.user.pk:
             raise PermissionDenied("You don't have permission to edit this exam.")
         
         return super().dispatch(request, *args, **kwargs)
@@ -251,7 +399,7 @@ class ExamDeleteView(DeleteView):
         exam = self.get_object()
         
         # Check permissions
-        if not request.user.is_superadmin and exam.created_by != request.user:
+        if not request.user.is_superadmin and exam.created_by_id != request.user.pk:
             raise PermissionDenied("You don't have permission to delete this exam.")
         
         return super().dispatch(request, *args, **kwargs)
@@ -262,10 +410,11 @@ class ExamDeleteView(DeleteView):
 
 @instructor_required
 def exam_toggle_status(request, pk):
-    exam = get_object_or_404(Exam, pk=pk)
+    # Only the permission check and the status flip need loading
+    exam = get_object_or_404(Exam.objects.only('status', 'created_by_id'), pk=pk)
     
     # Check permissions
-    if not request.user.is_superadmin and exam.created_by != request.user:
+    if not request.user.is_superadmin and exam.created_by_id != request.user.pk:
         raise PermissionDenied("You don't have permission to modify this exam.")
     
     # Toggle between DRAFT and LIVE status
@@ -276,7 +425,7 @@ def exam_toggle_status(request, pk):
         exam.status = Exam.Status.DRAFT
         action = "unpublished"
     
-    exam.save()
+    exam.save(update_fields=['status', 'updated_at'])
     messages.success(request, f'Exam {action} successfully.')
     
     return redirect('exams:exam_detail', pk=exam.pk)
@@ -288,6 +437,7 @@ class QuestionBankListView(ListView):
     template_name = 'exams/question_bank_list.html'
     context_object_name = 'question_banks'
     paginate_by = 20
+    paginator_class = FastCountPaginator
     
     def get_queryset(self):
         if self.request.user.is_superadmin:
@@ -319,18 +469,37 @@ class QuestionBankDetailView(DetailView):
     template_name = 'exams/question_bank_detail.html'
     context_object_name = 'question_bank'
     
+    questions_paginate_by = 50
+    
     def dispatch(self, request, *args, **kwargs):
         question_bank = self.get_object()
         
         # Check permissions
-        if not request.user.is_superadmin and question_bank.institution != request.user.institution:
+        if not request.user.is_superadmin and question_bank.institution_id != request.user.institution_id:
             raise PermissionDenied("You don't have permission to view this question bank.")
         
         return super().dispatch(request, *args, **kwargs)
     
+    def get_object(self, queryset=None):
+        # dispatch() already loaded the bank for the permission check
+        if not hasattr(self, '_question_bank'):
+            self._question_bank = super().get_object(queryset)
+        return self._question_bank
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['questions'] = self.object.questions.filter(is_active=True)
+        # The bank's stored count stands in for COUNT queries over the question rows
+        questions = self.object.questions.filter(is_active=True).only(
+            'id', 'bank', 'question_text', 'type', 'points'
+        ).order_by('pk')
+        paginator = Paginator(questions, self.questions_paginate_by)
+        paginator.count = self.object.active_question_count
+        page_obj = paginator.get_page(self.request.GET.get('page'))
+        context.update({
+            'questions': page_obj.object_list,
+            'page_obj': page_obj,
+            'is_paginated': page_obj.has_other_pages(),
+        })
         return context
 
 @method_decorator(instructor_required, name='dispatch')
@@ -454,47 +623,56 @@ class QuestionDeleteView(DeleteView):
         return super().delete(request, *args, **kwargs)
 
 @instructor_required
-def bulk_question_upload(request, bank_id):
-    question_bank = get_object_or_404(QuestionBank, pk=bank_id)
+def bulk_question_upload(request, question_bank_id):
+    question_bank = get_object_or_404(QuestionBank, pk=question_bank_id)
     
     # Check permissions
     if not request.user.is_superadmin and question_bank.institution != request.user.institution:
         raise PermissionDenied("You don't have permission to upload questions to this question bank.")
     
     if request.method == 'POST':
-        form = BulkQuestionUploadForm(request.POST, request.FILES)
+        form = BulkQuestionUploadForm(request.POST, request.FILES, question_bank=question_bank)
         if form.is_valid():
             try:
                 # Create a bulk import record
                 bulk_import = BulkQuestionImport(
                     uploaded_by=request.user,
                     question_bank=question_bank,
-                    import_file=form.cleaned_data['csv_file'],
+                    import_file=form.cleaned_data['import_file'],
                     status=BulkQuestionImport.Status.PENDING
                 )
                 bulk_import.save()
                 
-                # Process the import (in real app, this might be done async)
-                bulk_import.process_import()
+                # Process the import in the background once the record is committed
+                enqueue_bulk_import(bulk_import)
                 
                 messages.success(
                     request, 
-                    f"Import completed. {bulk_import.successful_imports} questions created, {bulk_import.failed_imports} failed."
+                    "Import started. Questions will appear in the bank as they are processed."
                 )
                 
-                if bulk_import.failed_imports > 0:
-                    messages.warning(request, "Some questions failed to import. Check the error log for details.")
-                
-                return redirect('exams:question_bank_detail', pk=bank_id)
+                # Come back to this page, which polls the import's progress
+                upload_url = reverse('exams:bulk_question_upload', args=[question_bank_id])
+                return redirect(f'{upload_url}?import={bulk_import.pk}')
                 
             except Exception as e:
                 messages.error(request, f'Error processing upload: {str(e)}')
     else:
-        form = BulkQuestionUploadForm()
+        form = BulkQuestionUploadForm(question_bank=question_bank)
+    
+    bulk_import = None
+    import_id = request.GET.get('import', '')
+    if import_id.isdigit():
+        bulk_import = BulkQuestionImport.objects.filter(
+            pk=import_id,
+            question_bank=question_bank,
+            uploaded_by=request.user
+        ).first()
     
     return render(request, 'exams/bulk_question_upload.html', {
         'form': form,
-        'question_bank': question_bank
+        'question_bank': question_bank,
+        'bulk_import': bulk_import
     })
 
 # Exam Attempt Views
@@ -503,25 +681,46 @@ class ExamAttemptListView(ListView):
     model = ExamAttempt
     template_name = 'exams/exam_attempt_list.html'
     context_object_name = 'attempts'
-    paginate_by = 20
+    # Attempt history grows without bound, so pages are keyed on the last id
+    # seen (?after=<id>) instead of OFFSET, and no total count is taken
+    page_size = 20
+    # Filter dropdowns are cached per user and capped so large institutions
+    # do not render thousands of options on every page
+    FILTER_OPTIONS_CACHE_TIMEOUT = 60
+    FILTER_OPTIONS_LIMIT = 500
     
     def get_queryset(self):
         if self.request.user.is_student:
-            return ExamAttempt.objects.filter(
+            queryset = ExamAttempt.objects.filter(
                 student=self.request.user
-            ).select_related('exam', 'device_session')
+            )
         else:
             # For educators, show attempts for exams they created or for their institution
             if self.request.user.is_superadmin:
-                return ExamAttempt.objects.all().select_related('exam', 'student', 'device_session')
+                queryset = ExamAttempt.objects.all()
             else:
-                return ExamAttempt.objects.filter(
-                    Q(exam__created_by=self.request.user) |
-                    Q(exam__sections__course__department__institution=self.request.user.institution)
-                ).distinct().select_related('exam', 'student', 'device_session')
+                queryset = ExamAttempt.objects.filter(
+                    exam__in=Exam.objects.managed_by(self.request.user)
+                )
+        
+        after = self.request.GET.get('after', '')
+        if after.isdigit():
+            queryset = queryset.filter(pk__lt=int(after))
+        
+        # Join and load only the columns the attempt rows display
+        return queryset.select_related('exam', 'student').only(
+            'status', 'start_time', 'end_time',
+            'exam__title', 'exam__total_points',
+            'student__username', 'student__first_name', 'student__last_name'
+        ).with_scores().order_by('-pk')
     
     def get_context_data(self, **kwargs):
+        # Fetch one extra row to learn whether an older page exists
+        attempts = list(self.object_list[:self.page_size + 1])
+        kwargs['object_list'] = attempts[:self.page_size]
         context = super().get_context_data(**kwargs)
+        context['next_after'] = attempts[self.page_size - 1].pk if len(attempts) > self.page_size else None
+        context['is_keyset_page'] = 'after' in self.request.GET
         
         if self.request.user.is_educator:
             # Add filter options for educators
@@ -529,27 +728,55 @@ class ExamAttemptListView(ListView):
             student_id = self.request.GET.get('student')
             status = self.request.GET.get('status')
             
-            if self.request.user.is_superadmin:
-                context['exams'] = Exam.objects.all()
-                context['students'] = User.objects.filter(role=User.Role.STUDENT)
-            else:
-                context['exams'] = Exam.objects.filter(
-                    Q(created_by=self.request.user) |
-                    Q(sections__course__department__institution=self.request.user.institution)
-                ).distinct()
-                context['students'] = User.objects.filter(
-                    institution=self.request.user.institution,
-                    role=User.Role.STUDENT
-                )
+            context['exams'], context['students'] = cache.get_or_set(
+                self.filter_options_cache_key(self.request.user),
+                self.get_filter_options,
+                self.FILTER_OPTIONS_CACHE_TIMEOUT
+            )
         
         return context
+    
+    @staticmethod
+    def filter_options_cache_key(user):
+        return f'attempt_list:filters:{user.pk}:{user.institution_id}'
+    
+    def get_filter_options(self):
+        """
+        Build the exam and student dropdown choices for the educator filters.
+        
+        Returns:
+            tuple: Lists of exam and student dicts, each capped at FILTER_OPTIONS_LIMIT
+        """
+        user = self.request.user
+        if user.is_superadmin:
+            exams = Exam.objects.all()
+            students = User.objects.filter(role=User.Role.STUDENT)
+        else:
+            exams = Exam.objects.managed_by(user)
+            students = User.objects.filter(
+                institution_id=user.institution_id,
+                role=User.Role.STUDENT
+            )
+        
+        exams = exams.order_by('title').values('id', 'title')[:self.FILTER_OPTIONS_LIMIT]
+        students = students.order_by('last_name', 'first_name').values(
+            'id', 'first_name', 'last_name'
+        )[:self.FILTER_OPTIONS_LIMIT]
+        return list(exams), list(students)
 
 @method_decorator(login_required, name='dispatch')
 class ExamAttemptDetailView(DetailView):
     model = ExamAttempt
+    queryset = ExamAttempt.objects.with_runtime_refs().with_event_timeline().with_scores()
     template_name = 'exams/exam_attempt_detail.html'
     context_object_name = 'attempt'
     
+    def get_object(self, queryset=None):
+        # dispatch() and get() both need the attempt, so fetch it and its timeline once
+        if not hasattr(self, '_attempt'):
+            self._attempt = super().get_object(queryset)
+        return self._attempt
+    
     def dispatch(self, request, *args, **kwargs):
         attempt = self.get_object()
         
@@ -559,28 +786,24 @@ class ExamAttemptDetailView(DetailView):
         
         # Educators can view attempts for their institution or their own exams
         if request.user.is_educator and not request.user.is_superadmin:
-            if (attempt.exam.created_by != request.user and 
-                not attempt.exam.sections.filter(
-                    course__department__institution=request.user.institution
-                ).exists()):
+            if not can_manage_exam(request.user, attempt.exam):
                 raise PermissionDenied("You don't have permission to view this attempt.")
         
         return super().dispatch(request, *args, **kwargs)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        # List responses in the order the questions appear on the exam
         context['responses'] = QuestionResponse.objects.filter(
             attempt=self.object
-        ).select_related('question')
-        context['monitoring_events'] = MonitoringEvent.objects.filter(
-            attempt=self.object
-        ).order_by('-timestamp')
+        ).select_related('question').order_by('order', 'pk')
+        context['monitoring_events'] = self.object.recent_monitoring_events
         return context
 
 # Exam Taking Views
 @student_required
 def start_exam(request, exam_id):
-    exam = get_object_or_404(Exam, pk=exam_id)
+    exam = get_object_or_404(Exam.objects.with_student_access(request.user), pk=exam_id)
     
     # Check if exam is available
     if not exam.is_active:
@@ -588,11 +811,7 @@ def start_exam(request, exam_id):
         return redirect('exams:exam_list')
     
     # Check if student is enrolled in any section that has this exam
-    if not Enrollment.objects.filter(
-        student=request.user,
-        section__in=exam.sections.all(),
-        is_active=True
-    ).exists():
+    if not exam.has_access:
         messages.error(request, 'You are not enrolled in any section with access to this exam.')
         return redirect('exams:exam_list')
     
@@ -617,7 +836,11 @@ def start_exam(request, exam_id):
 
 @student_required
 def take_exam(request, attempt_id):
-    attempt = get_object_or_404(ExamAttempt, pk=attempt_id, student=request.user)
+    attempt = get_object_or_404(
+        ExamAttempt.objects.with_timer_refs(), pk=attempt_id, student=request.user
+    )
+    # One timestamp for starting, timing and submitting within this request
+    now = timezone.now()
     
     # Check if attempt is valid
     if attempt.status == ExamAttempt.Status.SUBMITTED:
@@ -630,39 +853,39 @@ def take_exam(request, attempt_id):
             return redirect('exams:exam_password', attempt_id=attempt_id)
         
         # Start the exam
-        device_session = UserDeviceSession.create_from_request(request)
-        success, message = attempt.start_exam(device_session)
+        device_session = UserDeviceSession.create_from_request(request.user, request)
+        success, message = attempt.start_exam(device_session, now=now)
         
         if not success:
             messages.error(request, message)
             return redirect('exams:exam_list')
     
     # Check time limit
-    time_remaining = attempt.time_remaining
+    time_remaining = attempt.time_remaining_at(now)
     
     if time_remaining <= 0:
         attempt.status = ExamAttempt.Status.AUTO_SUBMITTED
         attempt.end_time = attempt.start_time + timedelta(minutes=attempt.exam.duration)
-        attempt.save()
+        attempt.save(update_fields=['status', 'end_time'])
         messages.info(request, 'Time is up! Your exam has been automatically submitted.')
         return redirect('exams:exam_attempt_detail', pk=attempt_id)
     
-    # Get questions for this exam
-    exam_questions = attempt.exam.exam_questions.select_related('question').order_by('order')
-    questions = [eq.question for eq in exam_questions]
+    # Question order is cached per exam; only the current question is loaded
+    question_ids = Exam.ordered_question_ids(attempt.exam_id)
     
     # Get current question index
     current_question_index = int(request.GET.get('question', 0))
     
-    if current_question_index >= len(questions):
+    if current_question_index >= len(question_ids):
         # Exam completed
         attempt.status = ExamAttempt.Status.SUBMITTED
-        attempt.end_time = timezone.now()
-        attempt.save()
+        attempt.end_time = now
+        attempt.save(update_fields=['status', 'end_time'])
         messages.success(request, 'Exam completed successfully!')
         return redirect('exams:exam_attempt_detail', pk=attempt_id)
     
-    current_question = questions[current_question_index]
+    current_question_id, current_order = question_ids[current_question_index]
+    current_question = get_object_or_404(Question, pk=current_question_id)
     
     # Handle form submission
     if request.method == 'POST':
@@ -670,29 +893,23 @@ def take_exam(request, attempt_id):
         # For now, we'll just save a generic response
         answer_data = {
             'answer': request.POST.get('answer'),
-            'timestamp': timezone.now().isoformat()
+            'timestamp': now.isoformat()
         }
         
         # Save response
-        response, created = QuestionResponse.objects.get_or_create(
-            attempt=attempt,
-            question=current_question,
-            defaults={'student_answer': answer_data}
+        QuestionResponse.record_answer(
+            attempt, current_question, answer_data, order=current_order
         )
         
-        if not created:
-            response.student_answer = answer_data
-            response.save()
-        
         # Move to next question or complete exam
         next_question_index = current_question_index + 1
-        if next_question_index < len(questions):
+        if next_question_index < len(question_ids):
             return redirect(f'{reverse("exams:take_exam", kwargs={"attempt_id": attempt_id})}?question={next_question_index}')
         else:
             # Exam completed
             attempt.status = ExamAttempt.Status.SUBMITTED
-            attempt.end_time = timezone.now()
-            attempt.save()
+            attempt.end_time = now
+            attempt.save(update_fields=['status', 'end_time'])
             messages.success(request, 'Exam completed successfully!')
             return redirect('exams:exam_attempt_detail', pk=attempt_id)
     
@@ -706,7 +923,7 @@ def take_exam(request, attempt_id):
         'attempt': attempt,
         'question': current_question,
         'question_index': current_question_index,
-        'total_questions': len(questions),
+        'total_questions': len(question_ids),
         'time_remaining': time_remaining,
         'existing_response': existing_response,
     }
@@ -715,14 +932,16 @@ def take_exam(request, attempt_id):
 
 @student_required
 def exam_password(request, attempt_id):
-    attempt = get_object_or_404(ExamAttempt, pk=attempt_id, student=request.user)
+    attempt = get_object_or_404(
+        ExamAttempt.objects.with_runtime_refs(), pk=attempt_id, student=request.user
+    )
     
     if attempt.status != ExamAttempt.Status.NOT_STARTED:
         return redirect('exams:take_exam', attempt_id=attempt_id)
     
     if request.method == 'POST':
-        password = request.POST.get('password')
-        device_session = UserDeviceSession.create_from_request(request)
+        password = request.POST.get('exam_password')
+        device_session = UserDeviceSession.create_from_request(request.user, request)
         success, message = attempt.start_exam(device_session, password)
         
         if success:
@@ -734,12 +953,14 @@ def exam_password(request, attempt_id):
 
 @student_required
 def submit_exam(request, attempt_id):
-    attempt = get_object_or_404(ExamAttempt, pk=attempt_id, student=request.user)
+    attempt = get_object_or_404(
+        ExamAttempt.objects.with_runtime_refs(), pk=attempt_id, student=request.user
+    )
     
     if attempt.status != ExamAttempt.Status.SUBMITTED:
         attempt.status = ExamAttempt.Status.SUBMITTED
         attempt.end_time = timezone.now()
-        attempt.save()
+        attempt.save(update_fields=['status', 'end_time'])
         
         # Calculate score (this would need to be implemented based on your grading logic)
         # calculate_exam_score(attempt)
@@ -755,35 +976,19 @@ def monitoring_dashboard(request, exam_id=None):
         exam = get_object_or_404(Exam, pk=exam_id)
         
         # Check permissions
-        if not request.user.is_superadmin and not exam.sections.filter(
-            course__department__institution=request.user.institution
-        ).exists() and exam.created_by != request.user:
+        if not can_manage_exam(request.user, exam):
             raise PermissionDenied("You don't have permission to monitor this exam.")
         
         active_attempts = ExamAttempt.objects.filter(
             exam=exam,
             status=ExamAttempt.Status.IN_PROGRESS
-        ).select_related('student', 'device_session')
+        ).select_related('student', 'device_session').order_by(
+            '-max_pending_severity', '-pending_events_count'
+        )
         
-        # Calculate risk levels for each attempt
+        # Calculate risk levels from the attempt's pending event summary
         for attempt in active_attempts:
-            # This is a simplified example - you'd implement your own risk calculation
-            violation_count = MonitoringEvent.objects.filter(
-                attempt=attempt,
-                event_type=MonitoringEvent.EventType.VIOLATION
-            ).count()
-            
-            warning_count = MonitoringEvent.objects.filter(
-                attempt=attempt,
-                event_type=MonitoringEvent.EventType.WARNING
-            ).count()
-            
-            if violation_count > 0:
-                attempt.risk_level = 'high'
-            elif warning_count > 1:
-                attempt.risk_level = 'medium'
-            else:
-                attempt.risk_level = 'low'
+            attempt.risk_level = attempt.event_risk_level
         
         context = {
             'exam': exam,
@@ -793,20 +998,19 @@ def monitoring_dashboard(request, exam_id=None):
         return render(request, 'exams/monitoring_dashboard.html', context)
     else:
         # Show list of exams that can be monitored
+        now = timezone.now()
         if request.user.is_superadmin:
             exams = Exam.objects.filter(
                 status=Exam.Status.LIVE,
-                start_date__lte=timezone.now(),
-                end_date__gte=timezone.now()
+                start_date__lte=now,
+                end_date__gte=now
             )
         else:
-            exams = Exam.objects.filter(
-                Q(created_by=request.user) |
-                Q(sections__course__department__institution=request.user.institution),
+            exams = Exam.objects.managed_by(request.user).filter(
                 status=Exam.Status.LIVE,
-                start_date__lte=timezone.now(),
-                end_date__gte=timezone.now()
-            ).distinct()
+                start_date__lte=now,
+                end_date__gte=now
+            )
         
         context = {
             'exams': exams,
@@ -816,39 +1020,19 @@ def monitoring_dashboard(request, exam_id=None):
 
 @instructor_required
 def monitoring_detail(request, attempt_id):
-    attempt = get_object_or_404(ExamAttempt, pk=attempt_id)
+    attempt = get_object_or_404(
+        ExamAttempt.objects.with_runtime_refs().with_event_timeline(),
+        pk=attempt_id
+    )
     
     # Check permissions
-    if not request.user.is_superadmin and not attempt.exam.sections.filter(
-        course__department__institution=request.user.institution
-    ).exists() and attempt.exam.created_by != request.user:
+    if not can_manage_exam(request.user, attempt.exam):
         raise PermissionDenied("You don't have permission to monitor this attempt.")
     
-    # Get monitoring events for this attempt
-    monitoring_events = MonitoringEvent.objects.filter(
-        attempt=attempt
-    ).order_by('-timestamp')
-    
-    # Calculate risk level
-    violation_count = monitoring_events.filter(
-        event_type=MonitoringEvent.EventType.VIOLATION
-    ).count()
-    
-    warning_count = monitoring_events.filter(
-        event_type=MonitoringEvent.EventType.WARNING
-    ).count()
-    
-    if violation_count > 0:
-        risk_level = 'high'
-    elif warning_count > 1:
-        risk_level = 'medium'
-    else:
-        risk_level = 'low'
-    
     context = {
         'attempt': attempt,
-        'monitoring_events': monitoring_events,
-        'risk_level': risk_level,
+        'monitoring_events': attempt.recent_monitoring_events,
+        'risk_level': attempt.event_risk_level,
     }
     
     return render(request, 'exams/monitoring_detail.html', context)
@@ -861,27 +1045,50 @@ def proctoring_webhook(request, attempt_id):
     
     try:
         data = json.loads(request.body)
-        event_type = data.get('event_type')
-        event_data = data.get('event_data', {})
-        timestamp = data.get('timestamp', timezone.now())
-        severity = data.get('severity', 5)
-        
-        MonitoringEvent.objects.create(
-            attempt=attempt,
-            event_type=event_type,
-            event_data=event_data,
-            timestamp=timestamp,
-            severity=severity
-        )
+        # Clients may report a single event or a batch of events at once
+        payloads = data.get('events', [data])
         
-        return JsonResponse({'status': 'success'})
+        events = []
+        for index, payload in enumerate(payloads):
+            facets, evidence = MonitoringEvent.split_evidence(payload.get('event_data', {}))
+            event = MonitoringEvent(
+                attempt=attempt,
+                event_type=payload.get('event_type'),
+                evidence=evidence,
+                description=payload.get('description', ''),
+                severity=payload.get('severity', 5),
+                **facets
+            )
+            # Events are acknowledged before the batched insert, which skips model
+            # validation, so reject the whole request if any event is invalid
+            errors = {}
+            try:
+                event.full_clean(
+                    exclude=['attempt', 'evidence'], validate_unique=False, validate_constraints=False
+                )
+            except ValidationError as e:
+                errors = e.message_dict
+            try:
+                # Evidence may be empty, so only its size limit applies
+                validate_evidence_size(evidence)
+            except ValidationError as e:
+                errors['evidence'] = e.messages
+            if errors:
+                return JsonResponse({'status': 'error', 'event': index, 'errors': errors}, status=400)
+            events.append(event)
+        buffer_monitoring_events(events)
+        
+        return JsonResponse({'status': 'accepted', 'queued': len(events)}, status=202)
     except Exception as e:
         return JsonResponse({'status': 'error', 'message': str(e)}, status=400)
 
 # API Views
 @login_required
 def api_exam_questions(request, exam_id):
-    exam = get_object_or_404(Exam, pk=exam_id)
+    exams = Exam.objects.all()
+    if request.user.is_student:
+        exams = exams.with_student_access(request.user)
+    exam = get_object_or_404(exams, pk=exam_id)
     
     # Check permissions
     if request.user.is_student:
@@ -889,11 +1096,7 @@ def api_exam_questions(request, exam_id):
             return JsonResponse({'error': 'Exam not available'}, status=403)
         
         # Check if student is enrolled
-        if not Enrollment.objects.filter(
-            student=request.user,
-            section__in=exam.sections.all(),
-            is_active=True
-        ).exists():
+        if not exam.has_access:
             return JsonResponse({'error': 'Access denied'}, status=403)
     
     questions = []
@@ -911,27 +1114,35 @@ def api_exam_questions(request, exam_id):
 
 @login_required
 def api_save_response(request, attempt_id, question_id):
-    attempt = get_object_or_404(ExamAttempt, pk=attempt_id)
-    question = get_object_or_404(Question, pk=question_id)
+    # Hit on every auto-save, so load only the attempt and exam columns used below
+    attempt = get_object_or_404(ExamAttempt.objects.with_timer_refs(), pk=attempt_id)
     
     # Check permissions
-    if request.user.is_student and attempt.student != request.user:
+    if request.user.is_student and attempt.student_id != request.user.pk:
         return JsonResponse({'error': 'Access denied'}, status=403)
     
+    # The question must be on this exam; its row also carries the display order
+    exam_question = get_object_or_404(
+        ExamQuestion.objects.select_related('question'),
+        exam_id=attempt.exam_id,
+        question_id=question_id
+    )
+    
     if request.method == 'POST':
+        # The cached timer may lag a submit in another process, so check the row itself
+        if attempt.time_remaining_at(timezone.now()) <= 0:
+            return JsonResponse({'error': 'Exam attempt is not in progress'}, status=403)
+        
         try:
             data = json.loads(request.body)
             answer_data = data.get('answer_data', {})
             
-            response, created = QuestionResponse.objects.get_or_create(
-                attempt=attempt,
-                question=question,
-                defaults={'student_answer': answer_data}
+            QuestionResponse.record_answer(
+                attempt, exam_question.question, answer_data, order=exam_question.order
             )
             
-            if not created:
-                response.student_answer = answer_data
-                response.save()
+            if attempt.session_token:
+                ActiveExamSession.record_activity(attempt.session_token)
             
             return JsonResponse({'status': 'success'})
         except Exception as e:
@@ -939,28 +1150,87 @@ def api_save_response(request, attempt_id, question_id):
     
     return JsonResponse({'error': 'Invalid method'}, status=405)
 
+@login_required
+def api_time_remaining(request, attempt_id):
+    # Polled frequently while an exam is open, so serve it from the cached timer
+    timer = ExamAttempt.get_timer(attempt_id)
+    if timer is None:
+        raise Http404("No exam attempt matches the given query.")
+    deadline, status, student_id = timer
+    
+    # Check permissions
+    if request.user.is_student and student_id != request.user.pk:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    time_remaining = 0
+    if deadline is not None:
+        time_remaining = max(0, deadline - timezone.now().timestamp())
+    
+    return JsonResponse({
+        'status': status,
+        'time_remaining': int(time_remaining)
+    })
+
+@instructor_required
+def download_import_template(request, question_bank_id):
+    question_bank = get_object_or_404(QuestionBank, pk=question_bank_id)
+    
+    # Check permissions
+    if not request.user.is_superadmin and question_bank.institution_id != request.user.institution_id:
+        raise PermissionDenied("You don't have permission to import into this question bank.")
+    
+    template = question_bank.get_import_template()
+    return FileResponse(template, as_attachment=True, filename=template.name)
+
+@instructor_required
+def api_bulk_import_status(request, import_id):
+    # Polled by the upload page while the import runs in the background
+    bulk_import = get_object_or_404(
+        BulkQuestionImport.objects.only(
+            'status', 'uploaded_by_id', 'total_records', 'successful_imports', 'failed_imports'
+        ),
+        pk=import_id
+    )
+    
+    # Check permissions
+    if not request.user.is_superadmin and bulk_import.uploaded_by_id != request.user.pk:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    return JsonResponse({
+        'status': bulk_import.status,
+        'status_display': bulk_import.get_status_display(),
+        'total_records': bulk_import.total_records,
+        'successful_imports': bulk_import.successful_imports,
+        'failed_imports': bulk_import.failed_imports,
+        'finished': bulk_import.status not in (
+            BulkQuestionImport.Status.PENDING, BulkQuestionImport.Status.PROCESSING
+        )
+    })
+
 # Report Views
 @instructor_required
 def exam_report(request, exam_id):
     exam = get_object_or_404(Exam, pk=exam_id)
     
     # Check permissions
-    if not request.user.is_superadmin and not exam.sections.filter(
-        course__department__institution=request.user.institution
-    ).exists() and exam.created_by != request.user:
+    if not can_manage_exam(request.user, exam):
         raise PermissionDenied("You don't have permission to view this report.")
     
     attempts = ExamAttempt.objects.filter(
         exam=exam,
         status=ExamAttempt.Status.SUBMITTED
-    ).select_related('student')
+    ).select_related('student').with_scores()
     
-    # Calculate statistics
+    # Calculate statistics; scores are summed per attempt in SQL
+    passed = Q(percentage__gte=exam.pass_percentage)
     stats = attempts.aggregate(
-        avg_score=Avg('score'),
-        max_score=Max('score'),
-        min_score=Min('score'),
-        avg_time=Avg(F('end_time') - F('start_time'))
+        avg_score=Avg('percentage'),
+        max_score=Max('percentage'),
+        min_score=Min('percentage'),
+        avg_time=Avg(F('end_time') - F('start_time')),
+        attempt_count=Count('id'),
+        pass_count=Count('id', filter=passed),
+        fail_count=Count('id', filter=~passed)
     )
     
     context = {
@@ -968,6 +1238,9 @@ def exam_report(request, exam_id):
         'attempts': attempts,
         'stats': stats,
     }
+    if stats['attempt_count']:
+        context['pass_rate'] = stats['pass_count'] / stats['attempt_count'] * 100
+        context['fail_rate'] = stats['fail_count'] / stats['attempt_count'] * 100
     
     return render(request, 'exams/exam_report.html', context)
 
@@ -976,36 +1249,43 @@ def export_exam_results(request, exam_id):
     exam = get_object_or_404(Exam, pk=exam_id)
     
     # Check permissions
-    if not request.user.is_superadmin and not exam.sections.filter(
-        course__department__institution=request.user.institution
-    ).exists() and exam.created_by != request.user:
+    if not can_manage_exam(request.user, exam):
         raise PermissionDenied("You don't have permission to export these results.")
     
     attempts = ExamAttempt.objects.filter(
         exam=exam,
         status=ExamAttempt.Status.SUBMITTED
-    ).select_related('student')
-    
-    response = HttpResponse(content_type='text/csv')
+    ).select_related('student').with_scores()
+    
+    writer = csv.writer(_EchoBuffer())
+    
+    def rows():
+        yield writer.writerow(['Student ID', 'Student Name', 'Score', 'Percentage', 'Start Time', 'End Time', 'Duration (min)'])
+        # Stream rows in chunks so large exams aren't held in memory
+        for attempt in attempts.iterator(chunk_size=1000):
+            duration = (attempt.end_time - attempt.start_time).total_seconds() / 60 if attempt.end_time else 0
+            yield writer.writerow([
+                attempt.student.username,
+                attempt.student.get_full_name(),
+                attempt.score,
+                f"{attempt.percentage:.2f}%" if attempt.percentage is not None else "N/A",
+                attempt.start_time,
+                attempt.end_time,
+                f"{duration:.2f}"
+            ])
+    
+    response = StreamingHttpResponse(rows(), content_type='text/csv')
     response['Content-Disposition'] = f'attachment; filename="{exam.title}_results.csv"'
-    
-    writer = csv.writer(response)
-    writer.writerow(['Student ID', 'Student Name', 'Score', 'Percentage', 'Start Time', 'End Time', 'Duration (min)'])
-    
-    for attempt in attempts:
-        duration = (attempt.end_time - attempt.start_time).total_seconds() / 60 if attempt.end_time else 0
-        writer.writerow([
-            attempt.student.username,
-            attempt.student.get_full_name(),
-            attempt.score or 0,
-            f"{(attempt.score / exam.total_points * 100):.2f}%" if attempt.score and exam.total_points else "N/A",
-            attempt.start_time,
-            attempt.end_time,
-            f"{duration:.2f}"
-        ])
-    
     return response
 
+
+class _EchoBuffer:
+    """File-like object that hands each CSV row straight back to the caller."""
+    
+    def write(self, value):
+        return value
+
+
 # Error handling
 def handler404(request, exception):
     return render(request, 'exams/404.html', status=404)